@@ -0,0 +1,70 @@
+"""Bundled static assets in ``static/``, shared by every session.
+
+``.streamlit/config.toml`` turns on static file serving, so the sidebar
+emblem is served by this app at ``/app/static/`` rather than fetched from
+Wikimedia, and it works offline. ``python assets.py`` downloads the
+original public-domain image into ``static/`` once; until then the
+sidebar shows it from its original URL. Streamlit sends static files with
+ETag/Last-Modified; their URLs also carry a content hash (``?v=...``), so
+a reverse proxy or CDN in front can cache ``/app/static/`` as immutable.
+The stylesheet is read from disk once per process and sent with each rerun.
+"""
+import argparse
+import hashlib
+import os
+import urllib.request
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_URL = '/app/static'
+LOGO = 'emblem.png'
+# Emblem of India (public domain), the image the sidebar has always shown.
+LOGO_SOURCE = 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Emblem_of_India.svg/240px-Emblem_of_India.svg.png'
+STYLESHEET = 'style.css'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def static_url(name, static_dir=STATIC_DIR):
+    """Versioned URL of a file in static/."""
+    with open(os.path.join(static_dir, name), 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:12]
+    return f'{STATIC_URL}/{name}?v={digest}'
+
+
+def logo_url(static_dir=STATIC_DIR):
+    """The bundled emblem's versioned URL, or its original URL if it has not been fetched."""
+    if os.path.exists(os.path.join(static_dir, LOGO)):
+        return static_url(LOGO, static_dir)
+    return LOGO_SOURCE
+
+
+def stylesheet(name=STYLESHEET):
+    """A static/ stylesheet as a ``<style>`` block for ``st.markdown``."""
+    with open(os.path.join(STATIC_DIR, name), encoding='utf-8') as f:
+        return f'<style>\n{f.read()}</style>'
+
+
+def fetch_logo(url=LOGO_SOURCE, static_dir=STATIC_DIR):
+    """Download the emblem into static/ and return its path."""
+    # Wikimedia refuses requests without a User-Agent.
+    request = urllib.request.Request(url, headers={'User-Agent': 'ONOE-assets/1.0'})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        data = response.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"{url} did not return a PNG image")
+    path = os.path.join(static_dir, LOGO)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the sidebar emblem into static/.")
+    parser.add_argument('--url', default=LOGO_SOURCE)
+    args = parser.parse_args()
+    print(f"Wrote {fetch_logo(args.url)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""Headless batch runner for the Impact Simulator.
+
+Evaluates the scenario grid for every state and writes the same reports the
+simulator's download button produces, one per (state, turnout change),
+without Streamlit. Reports are encoded in parallel on a
+process pool and written by the workers themselves; progress goes to stderr.
+The full long-format grid is also written once as ``national_grid.<ext>``.
+
+    python batch.py --out reports --format parquet xlsx
+    python batch.py --out reports --all-states --format xlsx   # national reports only
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from data_store import open_dataset
+from export import FORMATS, build_tables, encode_report
+from simulation import TURNOUT_MAX, TURNOUT_MIN, build_scenario_grid
+
+TASK_SCENARIOS = 16  # scenarios per worker task; keeps progress reporting fine-grained
+
+# Set once per worker process by _init_worker, so the inputs are pickled
+# once per worker rather than once per task.
+_df = None
+_grid = None
+
+
+def _init_worker(df, grid):
+    global _df, _grid
+    _df, _grid = df, grid
+
+
+def slug(name):
+    return re.sub(r'[^0-9A-Za-z]+', '_', name).strip('_').lower()
+
+
+def report_path(out_dir, state, impact, fmt):
+    folder = 'all_states' if state is None else slug(state)
+    ext = FORMATS[fmt][1]
+    # CSV and Parquet reports are both zip archives; keep their names apart.
+    stem = f't{impact:+d}' if ext == fmt else f't{impact:+d}_{fmt}'
+    return os.path.join(out_dir, folder, f'{stem}.{ext}')
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _run_task(task):
+    """Encode and write the reports for one state and a run of scenarios."""
+    state, scenarios, formats, out_dir = task
+    written = 0
+    for impact in scenarios:
+        tables = build_tables(_df, _grid, state, impact, all_states=state is None)
+        for fmt in formats:
+            data = encode_report(tables, fmt)
+            _write(report_path(out_dir, state, impact, fmt), data)
+            written += len(data)
+    return len(scenarios), written
+
+
+def make_tasks(grid, impacts, formats, out_dir, all_states=False, task_scenarios=TASK_SCENARIOS):
+    scenarios = [int(i) for i in impacts]
+    states = [None] if all_states else list(grid.states)
+    return [
+        (state, scenarios[lo:lo + task_scenarios], formats, out_dir)
+        for state in states
+        for lo in range(0, len(scenarios), task_scenarios)
+    ]
+
+
+def write_national_grid(grid, formats, out_dir):
+    frame = grid.to_frame()
+    os.makedirs(out_dir, exist_ok=True)
+    for fmt in formats:
+        path = os.path.join(out_dir, f'national_grid.{fmt}')
+        if fmt == 'xlsx':
+            _write(path, encode_report({'Scenario Grid': frame}, 'xlsx'))
+        elif fmt == 'csv':
+            frame.to_csv(path, index=False)
+        else:
+            frame.to_parquet(path, index=False)
+
+
+class Progress:
+    def __init__(self, total, stream=sys.stderr):
+        self.total = total
+        self.done = 0
+        self.stream = stream
+        self.start = time.perf_counter()
+        self._last_decile = -1
+        self._tty = stream.isatty()
+
+    def update(self, n):
+        self.done += n
+        elapsed = time.perf_counter() - self.start
+        rate = self.done / elapsed if elapsed else 0.0
+        eta = (self.total - self.done) / rate if rate else 0.0
+        line = (f'[{self.done:>{len(str(self.total))}}/{self.total}] {100 * self.done / self.total:5.1f}% '
+                f'{rate:,.0f} scenarios/s, eta {eta:.0f}s')
+        if self._tty:
+            self.stream.write('\r' + line)
+            if self.done == self.total:
+                self.stream.write('\n')
+        else:
+            decile = 10 * self.done // self.total
+            if decile != self._last_decile:
+                self._last_decile = decile
+                self.stream.write(line + '\n')
+        self.stream.flush()
+
+
+def run_batch(df, out_dir, formats=('parquet',), impacts=None, all_states=False,
+              workers=None, progress=None):
+    """Write every report for ``df``; returns (reports, bytes written)."""
+    grid = build_scenario_grid(df)
+    impacts = grid.impacts if impacts is None else impacts
+    write_national_grid(grid, formats, out_dir)
+
+    tasks = make_tasks(grid, impacts, formats, out_dir, all_states=all_states)
+    total = sum(len(task[1]) for task in tasks)
+    progress = progress or Progress(total)
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    reports = written = 0
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(df, grid)) as pool:
+            for future in as_completed([pool.submit(_run_task, task) for task in tasks]):
+                n, size = future.result()
+                reports += n * len(formats)
+                written += size
+                progress.update(n)
+    else:
+        _init_worker(df, grid)
+        for task in tasks:
+            n, size = _run_task(task)
+            reports += n * len(formats)
+            written += size
+            progress.update(n)
+    return reports, written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Impact Simulator reports for every state and scenario.")
+    parser.add_argument('--out', default='reports', help="output directory (default: reports)")
+    parser.add_argument('--format', nargs='+', choices=list(FORMATS), default=['parquet'], dest='formats')
+    parser.add_argument('--stations', default=None,
+                        help="station-level Parquet/Arrow file (default: $ONOE_STATIONS_PATH, else the built-in summary)")
+    parser.add_argument('--turnout', type=int, nargs='+', default=None,
+                        help=f"turnout changes to run ({TURNOUT_MIN}-{TURNOUT_MAX}; default: all)")
+    parser.add_argument('--all-states', action='store_true',
+                        help="one national report per scenario instead of one per state and scenario")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.turnout and not all(TURNOUT_MIN <= i <= TURNOUT_MAX for i in args.turnout):
+        parser.error(f"--turnout values must be between {TURNOUT_MIN} and {TURNOUT_MAX}")
+
+    start = time.perf_counter()
+    df = open_dataset(args.stations).state_frame()
+    reports, written = run_batch(df, args.out, args.formats, args.turnout,
+                                 all_states=args.all_states, workers=args.workers)
+    print(f"Wrote {reports:,} reports ({written / 2**20:.1f} MB) to {args.out} "
+          f"in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+"""App load benchmark: rerun latency and peak memory per page, with baselines.
+
+Drives app.py headlessly through Streamlit's AppTest harness the way users
+do: Home reruns, Simulator slider sweeps, Myth Buster query sets, a Quiz
+submission, Excel exports (the download button's deferred callable) and
+Election Calendar constraint changes. Every scenario runs in ``--sessions``
+concurrent session processes that start their timed pass together, each with
+caches warmed by one untimed pass. (AppTest installs its mock runtime
+process-wide, so sessions cannot share a process.) A session's first script
+run is a cold start (a fresh AppTest, its first render) and is never timed.
+Reported per scenario: p50/p95/max step latency, steps per second across all
+sessions, and the memory the page itself allocates. That is the largest
+tracemalloc peak of one step above the memory at its start, less the same
+figure for a rerun of an empty script, measured in one more pass per session.
+Without the subtraction every page shows AppTest's own ~1.3 MB first run.
+
+Each scenario is measured ``--runs`` times (default 3) and the median of every
+figure is reported, so one scheduler hiccup on a busy machine does not set the
+p95. Results are checked against benchmarks/baseline.json. A scenario fails
+when its p95 is more than ``--tolerance`` over the baseline (plus
+``--slack-ms``, so that millisecond-scale steps are not flaky) or its memory is
+more than ``--mem-tolerance`` (plus ``--slack-mb``) over it; the script then
+exits non-zero. Baselines depend on the machine, so record them where the
+check runs:
+
+    python benchmarks/bench_app.py --update-baseline
+    python benchmarks/bench_app.py --sessions 4 --scenario simulator quiz
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import multiprocessing
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, 'app.py')
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+TIMEOUT = 120
+MYTH_QUERIES = ('cost', 'evm', 'federal', 'voter turnout', 'elecshun', 'model code of conduct', 'zzzz', '')
+
+SESSION_TIMEOUT = 600
+# Logs "missing ScriptRunContext" when Streamlit is called outside a script
+# run (set-up code, worker threads), which is harmless in AppTest's bare mode.
+# AppTest re-applies Streamlit's logger.level on every run, so lowering the
+# level does not last; the logger is disabled instead.
+SCRIPT_RUN_CONTEXT_LOGGER = 'streamlit.runtime.scriptrunner_utils.script_run_context'
+
+# AppTest gives every run a fresh media file manager and drops it afterwards;
+# remember which one holds each deferred download so export steps can call it.
+_deferred_owner = {}
+_export_passes = itertools.count()
+
+
+class StepFailed(RuntimeError):
+    pass
+
+
+class Session:
+    """One browser tab: an AppTest plus the latency (or memory) of every timed step."""
+
+    def __init__(self, t, trace=False):
+        from streamlit.testing.v1 import AppTest
+
+        self.t = t
+        self.at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+        self.trace = trace   # record step memory peaks; tracemalloc must be running
+        self.samples = []
+        self.peaks = []
+
+    @contextmanager
+    def step(self, record=True):
+        if record and self.trace:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        if record:
+            self.samples.append(time.perf_counter() - start)
+            if self.trace:
+                self.peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+    def run(self, widget=None, record=True):
+        with self.step(record):
+            (widget or self.at).run()
+        if self.at.exception:
+            raise StepFailed(self.at.exception[0].message)
+
+    def open(self, page_key):
+        self.run(record=False)
+        if page_key != 'nav_home':
+            self.run(self.at.sidebar.radio[1].set_value(self.t[page_key]), record=False)
+
+    def widget(self, kind, label_key):
+        return next(w for w in getattr(self.at, kind) if w.label.startswith(self.t[label_key].split('{')[0]))
+
+
+def home(s):
+    s.open('nav_home')
+    for _ in range(5):
+        s.run()
+
+
+def simulator(s):
+    from simulation import TURNOUT_MAX, TURNOUT_MIN
+
+    s.open('nav_sim')
+    for impact in range(TURNOUT_MIN, TURNOUT_MAX + 1, 5):
+        s.run(s.widget('slider', 'turnout_sel').set_value(impact))
+    for state in s.widget('selectbox', 'state_sel').options[:5]:
+        s.run(s.widget('selectbox', 'state_sel').set_value(state))
+
+
+def myth_buster(s):
+    s.open('nav_myth')
+    for query in MYTH_QUERIES:
+        s.run(s.widget('text_input', 'myth_search').input(query))
+
+
+def quiz(s):
+    s.open('nav_quiz')
+    for radio in s.at.main.radio:
+        radio.set_value(radio.options[0])
+    s.run(s.at.main.button[0].click())
+
+
+def _record_media_files():
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.testing.v1 import app_test
+
+    class RecordedMediaFileManager(MediaFileManager):
+        def add_deferred(self, *args, **kwargs):
+            file_id = super().add_deferred(*args, **kwargs)
+            _deferred_owner[file_id] = self
+            return file_id
+
+    app_test.MediaFileManager = RecordedMediaFileManager
+
+
+def excel_export(s):
+    from simulation import TURNOUT_MIN
+
+    s.open('nav_sim')
+    s.run(s.widget('selectbox', 'export_format').set_value('xlsx'), record=False)
+    # Every pass in this process (warm-up, timed, memory) exports a different
+    # turnout change, so no export is served from the shared report cache.
+    impact = TURNOUT_MIN + next(_export_passes)
+    s.run(s.widget('slider', 'turnout_sel').set_value(impact), record=False)
+    for state in s.widget('selectbox', 'state_sel').options[:5]:
+        s.run(s.widget('selectbox', 'state_sel').set_value(state), record=False)
+        with s.step():
+            file_id = s.at.get('download_button')[0].proto.deferred_file_id
+            _deferred_owner.pop(file_id).execute_deferred(file_id)
+
+
+def election_calendar(s):
+    s.open('nav_calendar')
+    for phases in range(1, 6):
+        s.run(s.widget('slider', 'cal_max_phases').set_value(phases))
+    s.run(s.widget('checkbox', 'cal_fix_ls').uncheck())
+
+
+SCENARIOS = {
+    'home': home,
+    'simulator': simulator,
+    'myth_buster': myth_buster,
+    'quiz': quiz,
+    'excel_export': excel_export,
+    'election_calendar': election_calendar,
+}
+
+
+def _setup():
+    import logging
+
+    from content_store import ContentStore
+
+    logging.getLogger(SCRIPT_RUN_CONTEXT_LOGGER).disabled = True
+    _record_media_files()
+    return ContentStore().ui('English')
+
+
+def _apptest_step_peak():
+    """Step memory peak of a warm rerun of an empty script: AppTest's own share of every step."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string('import streamlit as st\nst.empty()', default_timeout=TIMEOUT)
+    at.run()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    at.run()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def _session(name, barrier, results):
+    """One session process: warm up, then the timed pass and the memory pass in step with the others."""
+    try:
+        t = _setup()
+        scenario = SCENARIOS[name]
+        scenario(Session(t))                   # warm-up: imports, caches, language pack
+        barrier.wait()
+        timed = Session(t)
+        scenario(timed)
+        barrier.wait()
+        tracemalloc.start()
+        traced = Session(t, trace=True)
+        scenario(traced)
+        overhead = _apptest_step_peak()
+        tracemalloc.stop()
+        results.put((timed.samples, max(max(traced.peaks) - overhead, 0)))
+    except Exception as exc:
+        results.put(f'{type(exc).__name__}: {exc}')
+        barrier.abort()
+        raise
+
+
+def measure_once(name, sessions):
+    """Run ``name`` in ``sessions`` concurrent session processes."""
+    from profiling import percentiles
+
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(sessions + 1)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_session, args=(name, barrier, results)) for _ in range(sessions)]
+    for proc in procs:
+        proc.start()
+    try:
+        barrier.wait(timeout=SESSION_TIMEOUT)
+        start = time.perf_counter()
+        barrier.wait(timeout=SESSION_TIMEOUT)
+        wall = time.perf_counter() - start
+        outcomes = [results.get(timeout=SESSION_TIMEOUT) for _ in procs]
+    except threading.BrokenBarrierError:
+        raise StepFailed(f"{name}: {results.get(timeout=SESSION_TIMEOUT)}") from None
+    finally:
+        for proc in procs:
+            proc.join()
+    errors = [outcome for outcome in outcomes if isinstance(outcome, str)]
+    if errors:
+        raise StepFailed(f"{name}: {errors[0]}")
+
+    samples = [x for steps, _ in outcomes for x in steps]
+    p50, p95 = percentiles(samples, (50, 95))
+    return {
+        'steps': len(samples),
+        'p50_ms': round(p50 * 1000, 1),
+        'p95_ms': round(p95 * 1000, 1),
+        'max_ms': round(max(samples) * 1000, 1),
+        'steps_per_s': round(len(samples) / wall, 1),
+        'mem_mb': round(max(peak for _, peak in outcomes) / 2**20, 2),
+    }
+
+
+def measure(name, sessions, runs):
+    """Median of every figure over ``runs`` runs of ``name``."""
+    results = [measure_once(name, sessions) for _ in range(runs)]
+    median = {key: round(statistics.median(r[key] for r in results), 2) for key in results[0]}
+    median['steps'] = results[0]['steps']
+    return median
+
+
+def regressions(name, result, base, tolerance, mem_tolerance, slack_ms, slack_mb):
+    found = []
+    limit = base['p95_ms'] * (1 + tolerance) + slack_ms
+    if result['p95_ms'] > limit:
+        found.append(f"{name}: p95 {result['p95_ms']:.0f} ms > {limit:.0f} ms (baseline {base['p95_ms']:.0f} ms)")
+    limit = base['mem_mb'] * (1 + mem_tolerance) + slack_mb
+    if result['mem_mb'] > limit:
+        found.append(f"{name}: memory {result['mem_mb']:.2f} MB > {limit:.2f} MB (baseline {base['mem_mb']:.2f} MB)")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=4, help="concurrent sessions per scenario (default: 4)")
+    parser.add_argument('--runs', type=int, default=3, help="runs per scenario; medians are reported (default: 3)")
+    parser.add_argument('--scenario', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS), dest='scenarios')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON (default: benchmarks/baseline.json)")
+    parser.add_argument('--update-baseline', action='store_true', help="record this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="allowed p95 growth over baseline (default: 0.5)")
+    parser.add_argument('--mem-tolerance', type=float, default=0.25,
+                        help="allowed memory growth over baseline (default: 0.25)")
+    parser.add_argument('--slack-ms', type=float, default=25.0, help="absolute p95 allowance (default: 25)")
+    parser.add_argument('--slack-mb', type=float, default=0.1, help="absolute memory allowance (default: 0.1)")
+    parser.add_argument('--json', action='store_true', help="print the results as JSON")
+    args = parser.parse_args()
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    baseline = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['sessions'] != args.sessions:
+            parser.error(f"the baseline was recorded with --sessions {baseline['sessions']}; "
+                         "use that or --update-baseline")
+
+    results, failed = {}, []
+    if not args.json:
+        print(f"{'scenario':<18} {'steps':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'steps/s':>8} "
+              f"{'mem MB':>8}  baseline p95 / MB")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Sessions inherit these: quiz submissions, report uploads and
+        # compiled packs stay out of var/.
+        os.environ.setdefault('ONOE_SUBMISSIONS_DB', os.path.join(tmp, 'submissions.db'))
+        os.environ.setdefault('ONOE_REPORTS_DIR', os.path.join(tmp, 'reports'))
+        os.environ.setdefault('ONOE_PACKS_DIR', os.path.join(tmp, 'packs'))
+        for name in args.scenarios:
+            results[name] = r = measure(name, args.sessions, args.runs)
+            base = (baseline or {}).get('scenarios', {}).get(name)
+            if base:
+                failed += regressions(name, r, base, args.tolerance, args.mem_tolerance,
+                                      args.slack_ms, args.slack_mb)
+            if not args.json:
+                versus = f"{base['p95_ms']:.0f} / {base['mem_mb']:.2f}" if base else '-'
+                print(f"{name:<18} {r['steps']:>5} {r['p50_ms']:>8.0f} {r['p95_ms']:>8.0f} {r['max_ms']:>8.0f} "
+                      f"{r['steps_per_s']:>8.1f} {r['mem_mb']:>8.2f}  {versus}", flush=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if args.update_baseline:
+        # Re-recording some scenarios keeps the others from the same setup.
+        recorded = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                previous = json.load(f)
+            if previous['sessions'] == args.sessions:
+                recorded = previous['scenarios']
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'sessions': args.sessions, 'runs': args.runs, 'python': platform.python_version(),
+                       'machine': platform.machine(), 'cpus': os.cpu_count(),
+                       'scenarios': {**recorded, **results}}, f, indent=2)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+    elif baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+    if failed:
+        print("Regressions:\n  " + '\n  '.join(failed))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
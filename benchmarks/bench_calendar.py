@@ -0,0 +1,58 @@
+"""Election-calendar optimizer benchmark.
+
+Solves the bundled legislature table and synthetic tables with more
+legislatures spread over a five-year window, across a range of phase
+limits, and reports the solve time (the optimizer re-solves on every
+constraint change in the UI).
+
+    python benchmarks/bench_calendar.py --legislatures 32 100 300 --phases 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calendar_sync import InfeasibleSchedule, load_legislatures, month_label, solve  # noqa: E402
+
+
+def synthetic_legislatures(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ends = 2027 * 12 + rng.integers(0, 60, size=n)
+    return pd.DataFrame({
+        'Legislature': ['Lok Sabha'] + [f'Assembly {i:03d}' for i in range(1, n)],
+        'Kind': ['Parliament'] + ['Assembly'] * (n - 1),
+        'Term Ends': [month_label(int(e)) for e in ends],
+        'Est. Election Cost (₹ Cr)': rng.uniform(20, 4500, size=n).round(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--legislatures', type=int, nargs='+', default=[32, 100, 300])
+    parser.add_argument('--phases', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    bundled = load_legislatures()
+    print(f"{'legislatures':>12} {'phases':>6} {'best ms':>8} {'chosen':>6}")
+    for n in args.legislatures:
+        table = bundled if n == len(bundled) else synthetic_legislatures(n)
+        for k in args.phases:
+            times, chosen = [], '-'
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                try:
+                    chosen = len(solve(table, max_phases=k, max_curtail=36, max_extend=24).phases)
+                except InfeasibleSchedule:
+                    chosen = '-'
+                times.append((time.perf_counter() - start) * 1000)
+            print(f'{n:>12} {k:>6} {min(times):>8.1f} {chosen!s:>6}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Cold-start benchmark: import time and first paint per page.
+
+Each page is measured in a fresh interpreter, the way the first request
+after a pod restart sees it: the time to import streamlit, the first script
+run (Home), and the first visit to the target page. The heavy libraries that
+were loaded at that point are listed too. The script exits non-zero when
+Home, Quiz or Myth Buster loads pandas, matplotlib, openpyxl or pyarrow
+(only the Simulator and Election Calendar need them), and with
+``--budget-ms`` when a page's first paint goes over budget.
+
+    python benchmarks/bench_cold_start.py --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'openpyxl', 'pyarrow')
+PAGES = ('nav_home', 'nav_sim', 'nav_myth', 'nav_calendar', 'nav_quiz')
+# Pages that must paint without the data stack.
+LIGHT_PAGES = ('nav_home', 'nav_myth', 'nav_quiz')
+LIGHT_FORBIDDEN = ('pandas', 'matplotlib', 'openpyxl', 'pyarrow')
+
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+import_ms = (time.perf_counter() - start) * 1000
+
+root, page_key, heavy = sys.argv[1], sys.argv[2], sys.argv[3].split(',')
+sys.path.insert(0, root)
+at = AppTest.from_file(f"{root}/app.py", default_timeout=120)
+start = time.perf_counter()
+at.run()
+home_ms = (time.perf_counter() - start) * 1000
+page_ms = home_ms
+if page_key != 'nav_home':
+    from content_store import ContentStore
+    label = ContentStore().ui('English')[page_key]
+    start = time.perf_counter()
+    at.sidebar.radio[1].set_value(label).run()
+    page_ms = (time.perf_counter() - start) * 1000
+assert not at.exception, at.exception
+print(json.dumps({
+    'import_ms': import_ms, 'home_ms': home_ms, 'page_ms': page_ms,
+    'loaded': [m for m in heavy if m in sys.modules],
+}))
+'''
+
+
+def measure(page_key):
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE, ROOT, page_key, ','.join(HEAVY_MODULES)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="fail if any page's first paint exceeds this")
+    args = parser.parse_args()
+
+    over_budget, too_heavy = [], []
+    print(f"{'page':<12} {'import ms':>10} {'home ms':>9} {'page ms':>9}  heavy modules loaded")
+    for page_key in PAGES:
+        r = measure(page_key)
+        print(f"{page_key:<12} {r['import_ms']:>10.0f} {r['home_ms']:>9.0f} {r['page_ms']:>9.0f}  "
+              f"{', '.join(r['loaded']) or '-'}")
+        if args.budget_ms is not None and r['page_ms'] > args.budget_ms:
+            over_budget.append(page_key)
+        forbidden = [m for m in r['loaded'] if m in LIGHT_FORBIDDEN]
+        if page_key in LIGHT_PAGES and forbidden:
+            too_heavy.append(f"{page_key} ({', '.join(forbidden)})")
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+    if too_heavy:
+        print(f"Loaded the data stack: {', '.join(too_heavy)}")
+    if over_budget or too_heavy:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
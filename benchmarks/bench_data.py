@@ -0,0 +1,74 @@
+"""Station-level dataset benchmark.
+
+Writes a synthetic polling-station table (default 1M rows) as Parquet and
+Arrow IPC, then reports cold load time, frame and resident memory, and
+state/constituency lookup latency for each format. Each load runs in a fresh
+interpreter so the numbers are cold-start numbers.
+
+    python benchmarks/bench_data.py --rows 1000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PROBE = r'''
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+from data_store import open_dataset, _rss_mb
+rss_before = _rss_mb()
+ds = open_dataset(sys.argv[2])
+states = list(ds.states.index)
+start = time.perf_counter()
+for i in range(1000):
+    ds.state(states[i % len(states)])
+state_us = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+for i in range(1000):
+    ds.stations_for(states[i % len(states)])
+slice_us = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    'rows': ds.stats.rows, 'load_s': ds.stats.load_seconds, 'frame_mb': ds.stats.frame_mb,
+    'rss_mb': ds.stats.rss_mb, 'rss_delta_mb': ds.stats.rss_mb - rss_before,
+    'state_lookup_us': state_us, 'station_slice_us': slice_us,
+}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    from data_store import synthetic_stations
+
+    stations = synthetic_stations(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            'parquet': os.path.join(tmp, 'stations.parquet'),
+            'arrow': os.path.join(tmp, 'stations.arrow'),
+        }
+        stations.to_parquet(paths['parquet'], index=False)
+        feather.write_feather(pa.Table.from_pandas(stations, preserve_index=False),
+                              paths['arrow'], compression='uncompressed')
+        del stations
+
+        print(f"{'format':<8} {'rows':>10} {'load s':>8} {'frame MB':>9} {'RSS MB':>8} {'+RSS MB':>8} "
+              f"{'state us':>9} {'slice us':>9}")
+        for fmt, path in paths.items():
+            out = subprocess.run([sys.executable, '-c', PROBE, ROOT, path],
+                                 check=True, capture_output=True, text=True).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{fmt:<8} {r['rows']:>10,} {r['load_s']:>8.2f} {r['frame_mb']:>9.1f} {r['rss_mb']:>8.1f} "
+                  f"{r['rss_delta_mb']:>8.1f} {r['state_lookup_us']:>9.1f} {r['station_slice_us']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
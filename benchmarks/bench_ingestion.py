@@ -0,0 +1,82 @@
+"""Misinformation-report ingestion benchmark.
+
+Fills the near-duplicate index with N random image hashes, then reports the
+lookup latency for near-duplicate and unseen queries, plus the end-to-end
+ingest time for real PNG/JPEG uploads (stream to disk + dHash + lookup).
+
+    python benchmarks/bench_ingestion.py --images 200000
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion import ReportIngestor, _to_signed, segments  # noqa: E402
+
+
+def _image_bytes(seed, fmt='PNG', size=(1080, 1920)):
+    from PIL import Image
+
+    pixels = (np.random.default_rng(seed).random((48, 27, 3)) * 255).astype('uint8')
+    buf = io.BytesIO()
+    Image.fromarray(pixels).resize(size).save(buf, format=fmt)
+    return buf.getvalue()
+
+
+def _percentiles(timings):
+    p50, p99 = np.percentile(timings, [50, 99])
+    return f"p50={p50:.1f}us p99={p99:.1f}us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--images', type=int, default=200_000)
+    parser.add_argument('--queries', type=int, default=2_000)
+    parser.add_argument('--uploads', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        ingestor = ReportIngestor(tmp)
+        hashes = [rng.getrandbits(64) for _ in range(args.images)]
+        with ingestor._conn:
+            ingestor._conn.executemany(
+                'INSERT INTO images (phash, seg0, seg1, seg2, seg3, reports, first_seen, last_seen, sample_path) '
+                "VALUES (?, ?, ?, ?, ?, 1, 0, 0, '')",
+                ([_to_signed(h), *segments(h)] for h in hashes),
+            )
+
+        near, unseen = [], []
+        for _ in range(args.queries):
+            flipped = rng.choice(hashes)
+            for bit in rng.sample(range(64), 3):
+                flipped ^= 1 << bit
+            start = time.perf_counter()
+            assert ingestor.find_similar(flipped) is not None
+            near.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            ingestor.find_similar(rng.getrandbits(64))
+            unseen.append((time.perf_counter() - start) * 1e6)
+        print(f"index={args.images:,} images")
+        print(f"lookup, 3-bit near-duplicate: {_percentiles(near)}")
+        print(f"lookup, unseen image:         {_percentiles(unseen)}")
+
+        uploads = [_image_bytes(i % 10, 'PNG' if i % 2 else 'JPEG') for i in range(args.uploads)]
+        start = time.perf_counter()
+        for data in uploads:
+            ingestor.ingest(io.BytesIO(data))
+        per_upload = (time.perf_counter() - start) / len(uploads) * 1000
+        top = ingestor.top_images(limit=args.uploads)
+        print(f"ingest: {per_upload:.1f} ms/upload, {len(uploads)} uploads -> "
+              f"{sum(1 for row in top if row['sample_path'])} unique images")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Language-pack benchmark: startup and memory as languages are added.
+
+Builds a throwaway content tree with N fully translated languages (copies of
+the English content with marked strings) and a fact base scaled up to
+``--facts`` entries. For each N it reports the store's startup time, the
+cold (compile) and warm (precompiled pack) first-load time for one language,
+and the memory held after a session picks that language. Startup and memory
+should not grow with N.
+
+    python benchmarks/bench_languages.py --languages 1 8 22 --facts 2000
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from content_store import CONTENT_DIR, ContentStore  # noqa: E402
+
+
+def build_tree(root, n_languages, n_facts):
+    en_dir = os.path.join(root, 'en')
+    shutil.copytree(os.path.join(CONTENT_DIR, 'en'), en_dir)
+    with open(os.path.join(en_dir, 'facts.json'), encoding='utf-8') as f:
+        facts = json.load(f)
+    base = list(facts.items())
+    facts = {f'{key}-{i}': entry for i in range(n_facts // len(base) + 1) for key, entry in base}
+    with open(os.path.join(en_dir, 'facts.json'), 'w', encoding='utf-8') as f:
+        json.dump(dict(list(facts.items())[:n_facts]), f, ensure_ascii=False)
+
+    manifest = {'English': 'en'}
+    for i in range(n_languages):
+        code = f'l{i:02d}'
+        manifest[f'Language {i:02d}'] = code
+        os.makedirs(os.path.join(root, code))
+        for kind in ('ui', 'facts', 'quiz'):
+            with open(os.path.join(en_dir, f'{kind}.json'), encoding='utf-8') as f:
+                text = f.read()
+            with open(os.path.join(root, code, f'{kind}.json'), 'w', encoding='utf-8') as f:
+                f.write(text.replace(': "', f': "[{code}] '))
+    with open(os.path.join(root, 'languages.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+
+def measure(root, packs_dir):
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = ContentStore(root, packs_dir)
+    startup_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    store.facts('Language 00')
+    load_ms = (time.perf_counter() - start) * 1000
+    held_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return startup_ms, load_ms, held_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--languages', type=int, nargs='+', default=[1, 8, 22])
+    parser.add_argument('--facts', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'languages':>9} {'startup ms':>10} {'cold load ms':>12} {'warm load ms':>12} {'held MB':>8} {'pack KB':>8}")
+    for n in args.languages:
+        with tempfile.TemporaryDirectory() as tmp:
+            root, packs_dir = os.path.join(tmp, 'content'), os.path.join(tmp, 'packs')
+            build_tree(root, n, args.facts)
+            startup_ms, cold_ms, _ = measure(root, packs_dir)
+            _, warm_ms, held_mb = measure(root, packs_dir)
+            pack_kb = os.path.getsize(os.path.join(packs_dir, 'l00.pack')) / 1024
+        print(f'{n:>9} {startup_ms:>10.2f} {cold_ms:>12.1f} {warm_ms:>12.1f} {held_mb:>8.2f} {pack_kb:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
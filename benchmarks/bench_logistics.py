@@ -0,0 +1,59 @@
+"""Logistics calculator benchmark.
+
+Builds a synthetic polling-station table (default 2M rows), then times a
+cold requirements pass over every state, a change to one state's phase
+count (only that state is re-aggregated), and a change to a global norm
+(no re-aggregation at all).
+
+    python benchmarks/bench_logistics.py --rows 2000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_store import open_dataset, synthetic_stations  # noqa: E402
+from logistics import LogisticsModel, LogisticsParams  # noqa: E402
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'stations.arrow')
+        synthetic_stations(args.rows).to_feather(path)
+        dataset = open_dataset(path)
+
+        cold_ms = timed(lambda: LogisticsModel(dataset).requirements(), args.repeat)
+        model = LogisticsModel(dataset)
+        model.requirements()
+        state = model.states[0]
+        phase_changes = iter(range(2, 2 + args.repeat))
+        phase_ms = timed(lambda: model.requirements(phases={state: next(phase_changes)}), args.repeat)
+        norm_ms = timed(lambda: model.requirements(LogisticsParams(candidates=20, polls=1)), args.repeat)
+        national = model.requirements().national
+
+    print(f"{args.rows:,} stations, {len(model.states)} states, {model.reductions} state reductions")
+    print(f"{'cold, all states':<28} {cold_ms:>8.1f} ms")
+    print(f"{'one state re-phased':<28} {phase_ms:>8.1f} ms")
+    print(f"{'global norm changed':<28} {norm_ms:>8.1f} ms")
+    print(', '.join(f'{key}: {value:,}' for key, value in national.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Myth Buster search benchmark.
+
+Builds the fact index over a synthetic bilingual fact base (default 50k
+entries) and reports build time, index memory and query latency percentiles
+for exact, prefix, typo and multi-word queries.
+
+    python benchmarks/bench_search.py --facts 50000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search import FactIndex  # noqa: E402
+
+EN_WORDS = (
+    "election commission voter turnout cost expenditure federal structure state assembly lok sabha "
+    "constitution amendment article governance model code conduct evm vvpat ballot security staff "
+    "logistics synchronize simultaneous polls campaign regional national party democracy rights "
+    "misinformation social media verified source report tenure dissolution president rule budget"
+).split()
+HI_WORDS = "चुनाव मतदाता लागत संघवाद संविधान राज्य विधानसभा लोकसभा आयोग मतदान सुरक्षा शासन".split()
+
+QUERY_SETS = {
+    'exact': ["cost", "evm", "constitution", "चुनाव", "voter rights"],
+    'prefix': ["const", "fed", "elec", "मत", "synchron"],
+    'typo': ["constituton", "federl", "expendture", "goverance", "democrazy"],
+    'multi': ["election commission independence", "cost of simultaneous polls", "state assembly tenure amendment"],
+}
+
+
+def synthetic_facts(n, seed=0):
+    rng = np.random.default_rng(seed)
+    words = np.array(EN_WORDS + HI_WORDS, dtype=object)
+    # Zipf-like term frequencies, like real text.
+    p = 1.0 / np.arange(1, len(words) + 1)
+    p /= p.sum()
+
+    def sentence(k):
+        return " ".join(rng.choice(words, size=k, p=p))
+
+    return {
+        f"topic {i} {sentence(2)}": {
+            'myth': sentence(12),
+            'fact': sentence(24),
+            'source': sentence(3),
+        }
+        for i in range(n)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--facts', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    facts = synthetic_facts(args.facts)
+
+    start = time.perf_counter()
+    index = FactIndex(facts)
+    build_s = time.perf_counter() - start
+
+    # Second build under tracemalloc (which slows it down) just for memory.
+    tracemalloc.start()
+    retained = FactIndex(facts)
+    index_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    del retained
+
+    print(f"facts={len(index):,} vocab={len(index.vocab):,} build={build_s:.2f}s index_mem={index_mb:.1f}MB")
+    print(f"{'query set':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hits':>8}")
+    for name, queries in QUERY_SETS.items():
+        timings, hits = [], 0
+        for _ in range(args.repeat):
+            for q in queries:
+                start = time.perf_counter()
+                hits = len(index.search(q, limit=args.limit))
+                timings.append((time.perf_counter() - start) * 1000)
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+        print(f"{name:<10} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f} {hits:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Per-session memory benchmark: what each additional session costs the server.
+
+A warm-up session visits every page in every language. That loads what all
+sessions share: imports, language packs, the dataset, the scenario grid,
+indexes and caches. Then ``--sessions`` more sessions do the same, and each
+keeps only what a server keeps between reruns, its session state. The traced
+memory growth per session is checked against ``--budget-kb``; the script
+exits non-zero when a session costs more. The shared footprint and the
+sessions that fit per GB are printed too. (Transient per-rerun peaks are
+covered by bench_app.py.)
+
+    python benchmarks/bench_sessions.py --sessions 50 --budget-kb 256
+"""
+import argparse
+import gc
+import logging
+import os
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def visit_all(app):
+    """Open a session and visit every page in every language; returns its session state."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app, default_timeout=120)
+    at.run()
+    for lang in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(lang).run()
+        for page in at.sidebar.radio[1].options:
+            at.sidebar.radio[1].set_value(page).run()
+            assert not at.exception, at.exception
+    return at.session_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--budget-kb', type=float, default=None,
+                        help="fail if one session retains more than this")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault('ONOE_SUBMISSIONS_DB', os.path.join(tmp, 'submissions.db'))
+        os.environ.setdefault('ONOE_REPORTS_DIR', os.path.join(tmp, 'reports'))
+        os.environ.setdefault('ONOE_PACKS_DIR', os.path.join(tmp, 'packs'))
+        # AppTest re-applies Streamlit's logger.level on every run; silence the
+        # bare-mode "missing ScriptRunContext" warning at its source instead.
+        logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').disabled = True
+        app = os.path.join(ROOT, 'app.py')
+
+        tracemalloc.start()
+        kept = [visit_all(app)]
+        gc.collect()
+        shared = tracemalloc.get_traced_memory()[0]
+        for _ in range(args.sessions):
+            kept.append(visit_all(app))
+        gc.collect()
+        per_session = (tracemalloc.get_traced_memory()[0] - shared) / args.sessions
+        tracemalloc.stop()
+
+    import profiling
+
+    state_kb = max(row['p95_kb'] for row in profiling.metrics.session_state_summary())
+    print(f"shared (first session, imports and caches): {shared / 2**20:.1f} MB")
+    print(f"per session: {per_session / 1024:.1f} KB retained "
+          f"(session state p95 {state_kb:.1f} KB) over {args.sessions} sessions")
+    print(f"sessions per GB at this rate: {2**30 / max(per_session, 1):,.0f}")
+    if args.budget_kb is not None and per_session / 1024 > args.budget_kb:
+        print(f"Over the {args.budget_kb:.0f} KB per-session budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Quiz-submission pipeline benchmark.
+
+Submits N random quiz results from several threads (as concurrent sessions
+would) and reports the latency the Submit path sees, the time for the
+background writer to catch up, and the aggregates read time.
+
+    python benchmarks/bench_submissions.py --submissions 50000 --threads 8
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from submissions import SubmissionSink  # noqa: E402
+
+QUESTIONS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--submissions', type=int, default=50_000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = SubmissionSink(os.path.join(tmp, 'bench.db'))
+        per_thread = args.submissions // args.threads
+        latencies = [[] for _ in range(args.threads)]
+
+        def worker(out):
+            rng = random.Random(len(out))
+            for _ in range(per_thread):
+                correct = [rng.random() < 0.6 for _ in range(QUESTIONS)]
+                start = time.perf_counter()
+                sink.submit('bench', 'English', correct, ['x'] * QUESTIONS)
+                out.append((time.perf_counter() - start) * 1e6)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(out,)) for out in latencies]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        submit_s = time.perf_counter() - start
+        sink.flush(timeout=600)
+        drained_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = sink.aggregates('bench')
+        read_ms = (time.perf_counter() - start) * 1000
+        sink.close()
+
+    total = per_thread * args.threads
+    p50, p99 = np.percentile(np.concatenate(latencies), [50, 99])
+    print(f"submissions={total:,} threads={args.threads}")
+    print(f"submit latency p50={p50:.1f}us p99={p99:.1f}us ({total / submit_s * 60:,.0f}/min offered)")
+    print(f"written to SQLite in {drained_s:.2f}s ({total / drained_s * 60:,.0f}/min sustained)")
+    print(f"aggregates read {read_ms:.2f}ms for {stats['submissions']:,} submissions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""Election-calendar synchronization optimizer.
+
+Given each legislature's term-end month and election cost, finds the
+schedule that brings them onto at most ``max_phases`` common polling dates
+while minimizing per-cycle expenditure plus a penalty for curtailed and
+extended terms.
+
+Every separate poll carries a fixed overhead (force deployment, staff
+training, EVM movement), so merging polls saves money and moving terms costs
+disruption. Sorted by term end, the optimal phases are contiguous runs of
+legislatures. The solver therefore evaluates every run at every candidate
+month at once (prefix sums over a legislature x month penalty matrix) and
+then picks the best split with a dynamic program over the sorted order. For
+30+ legislatures a solve takes a few milliseconds.
+"""
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+LEGISLATURES_PATH_ENV = 'ONOE_LEGISLATURES_PATH'
+DEFAULT_LEGISLATURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'legislatures.csv')
+COST_COLUMN = 'Est. Election Cost (₹ Cr)'
+
+PHASE_OVERHEAD = 1200.0    # ₹ Cr fixed cost of each separate poll
+DISRUPTION_WEIGHT = 20.0   # ₹ Cr-equivalent per legislature-month of term change
+EXTEND_PENALTY = 1.5       # an extended month (no fresh mandate) weighs more than a curtailed one
+MAX_CURTAIL, MAX_EXTEND, MAX_PHASES = 30, 12, 2
+FIXED = ('Lok Sabha',)     # terms that may not be changed by default
+
+
+class InfeasibleSchedule(ValueError):
+    pass
+
+
+def month_index(label):
+    """'YYYY-MM' -> months since year 0."""
+    year, month = label.split('-')[:2]
+    return int(year) * 12 + int(month) - 1
+
+
+def month_label(index):
+    return f'{index // 12}-{index % 12 + 1:02d}'
+
+
+def load_legislatures(path=None):
+    """Term ends and costs from ``path`` (or $ONOE_LEGISLATURES_PATH, else data/legislatures.csv)."""
+    path = path or os.environ.get(LEGISLATURES_PATH_ENV, DEFAULT_LEGISLATURES_PATH)
+    return pd.read_csv(path, dtype={'Term Ends': str})
+
+
+@dataclass(frozen=True)
+class Schedule:
+    phases: tuple             # ((month label, (legislature, ...)), ...) in date order
+    assignments: pd.DataFrame  # one row per legislature
+    expenditure: float        # ₹ Cr per cycle once synchronized
+    status_quo: float         # ₹ Cr per cycle on the current calendar
+    curtailed_months: int     # legislature-months cut short
+    extended_months: int      # legislature-months added
+    objective: float
+    frontier: pd.DataFrame    # best schedule for each phase count
+    solve_ms: float
+
+    @property
+    def savings(self):
+        return self.status_quo - self.expenditure
+
+
+def _group_costs(ends, is_fixed, dates, max_curtail, max_extend, disruption_weight, extend_penalty):
+    """Cheapest date and penalty for every contiguous run [i, j) of legislatures."""
+    shift = dates[None, :] - ends[:, None]                      # (n, D); > 0 extends the term
+    curtail = np.maximum(-shift, 0)
+    extend = np.maximum(shift, 0)
+    feasible = (curtail <= max_curtail) & (extend <= max_extend)
+    feasible[is_fixed] &= shift[is_fixed] == 0
+    penalty = np.where(feasible, disruption_weight * (curtail + extend_penalty * extend), 0.0)
+
+    n, n_dates = len(ends), len(dates)
+    total = np.zeros((n + 1, n_dates))
+    np.cumsum(penalty, axis=0, out=total[1:])
+    blocked = np.zeros((n + 1, n_dates), dtype=np.int64)
+    np.cumsum(~feasible, axis=0, out=blocked[1:])
+
+    runs = total[None, :, :] - total[:, None, :]                # (i, j, D)
+    runs[(blocked[None, :, :] - blocked[:, None, :]) > 0] = np.inf
+    best_date = runs.argmin(axis=2)
+    cost = np.take_along_axis(runs, best_date[..., None], axis=2)[..., 0]
+    cost[np.tril_indices(n + 1)] = np.inf                       # only i < j is a run
+    return cost, best_date
+
+
+def _split(cost, max_phases):
+    """best[k, j]: cheapest way to cover the first j legislatures with k phases."""
+    n = cost.shape[0] - 1
+    best = np.full((max_phases + 1, n + 1), np.inf)
+    best[0, 0] = 0.0
+    back = np.zeros((max_phases + 1, n + 1), dtype=np.int64)
+    for k in range(1, max_phases + 1):
+        candidates = best[k - 1][:, None] + cost
+        back[k] = candidates.argmin(axis=0)
+        best[k] = candidates.min(axis=0)
+    return best, back
+
+
+def _runs(back, k, n):
+    runs = []
+    j = n
+    while k:
+        i = back[k, j]
+        runs.append((i, j))
+        j, k = i, k - 1
+    return runs[::-1]
+
+
+def solve(legislatures, max_curtail=MAX_CURTAIL, max_extend=MAX_EXTEND, max_phases=MAX_PHASES,
+          disruption_weight=DISRUPTION_WEIGHT, extend_penalty=EXTEND_PENALTY,
+          phase_overhead=PHASE_OVERHEAD, fixed=FIXED, earliest=None):
+    """Best synchronization schedule with at most ``max_phases`` polling dates.
+
+    ``earliest`` (a 'YYYY-MM' label) rules out dates before it, e.g. months
+    that have already passed.
+    """
+    start = time.perf_counter()
+    df = legislatures.assign(_end=legislatures['Term Ends'].map(month_index))
+    df = df.sort_values('_end', kind='stable').reset_index(drop=True)
+    names = df['Legislature'].tolist()
+    ends = df['_end'].to_numpy(dtype=np.int64)
+    costs = df[COST_COLUMN].to_numpy(dtype=np.float64)
+    is_fixed = df['Legislature'].isin(fixed).to_numpy()
+    n = len(df)
+
+    lo = int(ends.min()) - max_curtail
+    if earliest is not None:
+        lo = max(lo, month_index(earliest))
+    dates = np.arange(lo, int(ends.max()) + max_extend + 1)
+    if not len(dates):
+        raise InfeasibleSchedule(
+            f"No polling date from {earliest} fits the term limits; the last term ends "
+            f"{month_label(int(ends.max()))} and may be extended by at most {max_extend} month(s).")
+    max_phases = max(1, min(int(max_phases), n))
+
+    cost, best_date = _group_costs(ends, is_fixed, dates, max_curtail, max_extend,
+                                   disruption_weight, extend_penalty)
+    best, back = _split(cost, max_phases)
+    base_cost = float(costs.sum())
+
+    frontier = []
+    for k in range(1, max_phases + 1):
+        if not np.isfinite(best[k, n]):
+            continue
+        shifts = np.concatenate([dates[best_date[i, j]] - ends[i:j] for i, j in _runs(back, k, n)])
+        frontier.append({
+            'Phases': k,
+            'Expenditure (₹ Cr)': base_cost + k * phase_overhead,
+            'Curtailed (months)': int(np.maximum(-shifts, 0).sum()),
+            'Extended (months)': int(np.maximum(shifts, 0).sum()),
+            'Objective': best[k, n] + k * phase_overhead + base_cost,
+        })
+    if not frontier:
+        raise InfeasibleSchedule(
+            f"No schedule with at most {max_phases} phase(s) fits the term limits; "
+            "allow more phases or longer curtailment/extension.")
+    frontier = pd.DataFrame(frontier)
+    chosen = frontier.loc[frontier['Objective'].idxmin()]
+    k = int(chosen['Phases'])
+
+    phases, rows = [], []
+    for phase, (i, j) in enumerate(_runs(back, k, n), start=1):
+        date = int(dates[best_date[i, j]])
+        phases.append((month_label(date), tuple(names[i:j])))
+        for m in range(i, j):
+            rows.append({
+                'Legislature': names[m],
+                'Kind': df.at[m, 'Kind'],
+                'Term Ends': month_label(int(ends[m])),
+                'Election': month_label(date),
+                'Phase': phase,
+                'Term Change (months)': date - int(ends[m]),
+            })
+
+    return Schedule(
+        phases=tuple(phases),
+        assignments=pd.DataFrame(rows),
+        expenditure=float(chosen['Expenditure (₹ Cr)']),
+        status_quo=base_cost + len(np.unique(ends)) * phase_overhead,
+        curtailed_months=int(chosen['Curtailed (months)']),
+        extended_months=int(chosen['Extended (months)']),
+        objective=float(chosen['Objective']),
+        frontier=frontier,
+        solve_ms=(time.perf_counter() - start) * 1000,
+    )
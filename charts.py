@@ -0,0 +1,62 @@
+"""Rendered-chart layer for the Impact Simulator.
+
+Each distinct chart is rasterized once into PNG/SVG bytes and kept in a
+size-bounded LRU shared across sessions. Figures are built on the object
+oriented ``Figure`` API (never registered with pyplot) and cleared as soon as
+they are serialized, so nothing accumulates between reruns.
+"""
+import threading
+import time
+from io import BytesIO
+
+from caching import BytesLRUCache
+
+CHART_CACHE_BYTES = 32 * 1024 * 1024
+COST_COLORS = ('#ff9999', '#99ff99')
+MIME_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+
+def render_cost_chart(categories, costs, xlabel, fmt='png', dpi=150):
+    """Draw the current-vs-ONOE cost bar chart and return the encoded bytes."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 3))
+    FigureCanvasAgg(fig)
+    try:
+        ax = fig.subplots()
+        ax.barh(categories, costs, color=COST_COLORS)
+        ax.set_xlabel(xlabel)
+        buf = BytesIO()
+        fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight')
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+class ChartRenderer:
+    def __init__(self, max_bytes=CHART_CACHE_BYTES):
+        self.cache = BytesLRUCache(max_bytes)
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def cost_chart(self, state, lang, categories, costs, xlabel, fmt='png'):
+        key = ('cost', state, lang, fmt, tuple(categories), tuple(round(c, 6) for c in costs), xlabel)
+        return self.cache.get_or_create(key, lambda: self._render(categories, costs, xlabel, fmt))
+
+    def _render(self, categories, costs, xlabel, fmt):
+        start = time.perf_counter()
+        data = render_cost_chart(categories, costs, xlabel, fmt=fmt)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.renders += 1
+            self.render_seconds += elapsed
+        return data
+
+    def stats(self):
+        stats = self.cache.stats()
+        with self._lock:
+            stats['renders'] = self.renders
+            stats['avg_render_ms'] = 1000 * self.render_seconds / self.renders if self.renders else 0.0
+        return stats
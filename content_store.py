@@ -0,0 +1,225 @@
+"""Translation catalog: UI strings, Myth Buster facts and the quiz per language.
+
+Sources live in ``content/<code>/{ui,facts,quiz}.json``. ``content/languages.json``
+lists every scheduled language. A language appears in the app once its source
+directory exists. Each language is compiled into a single pack in
+``var/packs/<code>.pack`` (or ``$ONOE_PACKS_DIR``). A pack is zlib-compressed
+JSON of all three kinds, already merged with English per key, so a
+partially translated language still has every string, fact and question.
+
+Packs are plain data, never code. Each pack records the path, size and
+mtime (ns) of the source files it was compiled from; a pack whose manifest
+no longer matches the files on disk is recompiled, so checking it costs a
+few ``stat`` calls. Packs are compiled on first use, or ahead of time with
+``python content_store.py``. The store is opened once per
+process (via ``st.cache_resource``). Startup reads only the manifest. A pack
+is loaded the first time a session picks that language, and at most
+``max_packs`` stay resident (least recently used are dropped). Loaded packs
+are frozen: read-only mappings and tuples that every session shares, with
+interned strings, so the English fallback text repeated across packs is
+held once.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from types import MappingProxyType
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.join(_HERE, 'content')
+PACKS_DIR_ENV = 'ONOE_PACKS_DIR'
+DEFAULT_PACKS_DIR = os.path.join(_HERE, 'var', 'packs')
+
+DEFAULT_LANGUAGE = 'English'
+KINDS = ('ui', 'facts', 'quiz')
+PACK_FORMAT = 3
+MAX_PACKS = 4
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _merge(kind, base, override):
+    """Overlay a translation on the English content, key by key."""
+    if override is None:
+        return base, 0
+    if kind == 'ui':
+        return {**base, **override}, len(base.keys() & override.keys())
+    if kind == 'facts':
+        merged = {key: {**entry, **override.get(key, {})} for key, entry in base.items()}
+        merged.update((key, entry) for key, entry in override.items() if key not in base)
+        return merged, len(base.keys() & override.keys())
+    # quiz: questions are matched by position
+    merged = [{**q, **override[i]} if i < len(override) else q for i, q in enumerate(base)]
+    merged.extend(override[len(base):])
+    return merged, min(len(base), len(override))
+
+
+def _version(data):
+    return hashlib.sha1(json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def sources_manifest(root, code, base_code):
+    """[path, size, mtime_ns] of each source file a language's pack is compiled from."""
+    manifest = []
+    for c in dict.fromkeys((base_code, code)):
+        for kind in KINDS:
+            path = f'{c}/{kind}.json'
+            try:
+                st = os.stat(os.path.join(root, path))
+                manifest.append([path, st.st_size, st.st_mtime_ns])
+            except FileNotFoundError:
+                manifest.append([path, None, None])
+    return manifest
+
+
+def compile_pack(root, code, base_code):
+    """Build one language's pack: merged content, per-kind versions and coverage."""
+    pack = {'format': PACK_FORMAT, 'code': code, 'sources': sources_manifest(root, code, base_code),
+            'versions': {}, 'coverage': {}}
+    for kind in KINDS:
+        base = _read_json(os.path.join(root, base_code, f'{kind}.json'))
+        if code == base_code:
+            data, translated = base, len(base)
+        else:
+            data, translated = _merge(kind, base, _read_json(os.path.join(root, code, f'{kind}.json')))
+        pack[kind] = data
+        pack['versions'][kind] = _version(data)
+        pack['coverage'][kind] = (translated, len(base))
+    return pack
+
+
+def freeze(obj):
+    """Read-only, compact copy: dicts become mapping proxies, lists tuples, strings interned."""
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(key): freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(value) for value in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+def write_pack(pack, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{threading.get_ident()}-{time.monotonic_ns()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(zlib.compress(json.dumps(pack, ensure_ascii=False).encode('utf-8'), 6))
+    os.replace(tmp_path, path)
+
+
+def read_pack(path):
+    with open(path, 'rb') as f:
+        return json.loads(zlib.decompress(f.read()).decode('utf-8'))
+
+
+def is_current(pack, sources):
+    """True if ``pack`` is in this format and was compiled from the ``sources`` manifest."""
+    return isinstance(pack, dict) and pack.get('format') == PACK_FORMAT and pack.get('sources') == sources
+
+
+class ContentStore:
+    def __init__(self, root=CONTENT_DIR, packs_dir=None, max_packs=MAX_PACKS):
+        self.root = root
+        self.packs_dir = packs_dir or os.environ.get(PACKS_DIR_ENV, DEFAULT_PACKS_DIR)
+        self.max_packs = max_packs
+        with open(os.path.join(root, 'languages.json'), encoding='utf-8') as f:
+            self.scheduled = json.load(f)
+        # Languages with any source content; the rest are listed but not offered yet.
+        self.languages = {name: code for name, code in self.scheduled.items()
+                          if os.path.isdir(os.path.join(root, code))}
+        self._base_code = self.scheduled[DEFAULT_LANGUAGE]
+        self._packs = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def compile(self, lang):
+        """(Re)compile one language's pack to disk and return it."""
+        code = self.languages[lang]
+        pack = compile_pack(self.root, code, self._base_code)
+        try:
+            write_pack(pack, os.path.join(self.packs_dir, f'{code}.pack'))
+        except OSError:
+            pass  # read-only deploy: serve the freshly compiled pack from memory
+        return pack
+
+    def _open(self, lang):
+        code = self.languages[lang]
+        path = os.path.join(self.packs_dir, f'{code}.pack')
+        try:
+            pack = read_pack(path)
+        except (OSError, ValueError, zlib.error):
+            pack = None
+        if pack is not None and is_current(pack, sources_manifest(self.root, code, self._base_code)):
+            return pack
+        return self.compile(lang)
+
+    def _pack(self, lang):
+        if lang not in self.languages:
+            lang = DEFAULT_LANGUAGE
+        with self._lock:
+            pack = self._packs.get(lang)
+            if pack is not None:
+                self._packs.move_to_end(lang)
+                return pack
+            pack = freeze(self._open(lang))
+            self._packs[lang] = pack
+            self.loads += 1
+            while len(self._packs) > self.max_packs:
+                self._packs.popitem(last=False)
+                self.evictions += 1
+        return pack
+
+    def ui(self, lang):
+        return self._pack(lang)['ui']
+
+    def facts(self, lang):
+        return self._pack(lang)['facts']
+
+    def quiz(self, lang):
+        return self._pack(lang)['quiz']
+
+    def version(self, kind, lang):
+        """Content hash of one kind after fallback, used to key caches built from it."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown content kind: {kind!r}")
+        return self._pack(lang)['versions'][kind]
+
+    def coverage(self, lang):
+        """{kind: (translated, total)} for one language."""
+        return self._pack(lang)['coverage']
+
+    def stats(self):
+        with self._lock:
+            return {'resident': list(self._packs), 'loads': self.loads, 'evictions': self.evictions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile language packs from content/.")
+    parser.add_argument('--root', default=CONTENT_DIR)
+    parser.add_argument('--packs-dir', default=None)
+    args = parser.parse_args()
+
+    store = ContentStore(args.root, args.packs_dir)
+    for lang, code in store.languages.items():
+        coverage = store.compile(lang)['coverage']
+        summary = ', '.join(f'{kind} {done}/{total}' for kind, (done, total) in coverage.items())
+        print(f'{code:>4}  {lang:<10} {summary}')
+    missing = [lang for lang in store.scheduled if lang not in store.languages]
+    if missing:
+        print(f'no content yet: {", ".join(missing)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""Dataset backend for the simulator: polling-station rows plus rollups.
+
+Station-level data (one row per polling station, ~1M rows nationally) is
+read from a memory-mapped Arrow IPC/Feather or Parquet file with categorical
+``State``/``Constituency`` columns and compact numeric dtypes. Rows are kept
+sorted by state, so one state's stations are a contiguous slice found by
+offset, and the state and constituency rollups are computed once at load
+time and looked up by index.
+
+Without a station file the app falls back to the built-in six-state summary.
+"""
+import os
+import resource
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+STATIONS_PATH_ENV = 'ONOE_STATIONS_PATH'
+
+STATION_DTYPES = {
+    'Polling Station': 'int32',
+    'Electors': 'int32',
+    'Votes Polled': 'int32',
+    'Est. Election Cost (₹ Cr)': 'float32',
+}
+CATEGORY_COLUMNS = ('State', 'Constituency')
+
+# Representative state-level summary used when no station file is configured.
+BUILTIN_STATES = {
+    'State': ['Uttar Pradesh', 'Maharashtra', 'West Bengal', 'Bihar', 'Tamil Nadu', 'NCT of Delhi'],
+    'Voters (Cr)': [15.4, 9.3, 7.6, 7.7, 6.2, 1.5],
+    'Est. Election Cost (₹ Cr)': [4500, 3200, 2800, 2500, 2100, 1500],
+    'Turnout (%)': [57.0, 61.5, 79.5, 56.3, 70.1, 58.8],
+    'Polling Stations': [162069, 98140, 80530, 77462, 68321, 13641]
+}
+
+
+@dataclass(frozen=True)
+class LoadStats:
+    source: str
+    rows: int
+    load_seconds: float
+    frame_mb: float
+    rss_mb: float
+
+
+def _rss_mb():
+    # Current resident set size from /proc; fall back to the peak on other OSes.
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def read_stations(path):
+    """Read a station file memory-mapped, with categorical keys and compact dtypes."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.endswith(('.arrow', '.feather', '.ipc')):
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    else:
+        table = pq.read_table(path, memory_map=True, read_dictionary=list(CATEGORY_COLUMNS))
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    for col in CATEGORY_COLUMNS:
+        if df[col].dtype != 'category':
+            df[col] = df[col].astype('category')
+    return df.astype(STATION_DTYPES)
+
+
+def _rollup(stations, by):
+    grouped = stations.groupby(list(by), observed=True, sort=True)
+    out = grouped.agg(
+        electors=('Electors', 'sum'),
+        votes=('Votes Polled', 'sum'),
+        cost=('Est. Election Cost (₹ Cr)', 'sum'),
+        stations=('Polling Station', 'size'),
+    )
+    return pd.DataFrame({
+        'Voters (Cr)': out['electors'] / 1e7,
+        'Est. Election Cost (₹ Cr)': out['cost'].astype('float64'),
+        'Turnout (%)': (100.0 * out['votes'] / out['electors']).round(1),
+        'Polling Stations': out['stations'].astype('int64'),
+    }, index=out.index)
+
+
+class Dataset:
+    def __init__(self, states, stations=None, constituencies=None, stats=None):
+        self.states = states                  # indexed by State
+        self.stations = stations              # sorted by State, or None
+        self.constituencies = constituencies  # indexed by (State, Constituency), or None
+        self.stats = stats
+        if stations is not None:
+            codes = stations['State'].cat.codes.to_numpy()
+            categories = stations['State'].cat.categories
+            bounds = np.searchsorted(codes, np.arange(len(categories) + 1))
+            self._slices = {state: (bounds[i], bounds[i + 1]) for i, state in enumerate(categories)}
+
+    def state_frame(self):
+        """State-level table in the shape the simulator expects."""
+        return self.states.reset_index()
+
+    def state(self, name):
+        return self.states.loc[name]
+
+    def stations_for(self, name):
+        """A state's polling stations, as a contiguous slice (no column scan)."""
+        if self.stations is None:
+            raise LookupError("No station-level data loaded")
+        lo, hi = self._slices[name]
+        return self.stations.iloc[lo:hi]
+
+    def constituencies_for(self, name):
+        if self.constituencies is None:
+            raise LookupError("No station-level data loaded")
+        return self.constituencies.loc[name]
+
+
+def open_dataset(path=None):
+    """Load station-level data from ``path`` (or $ONOE_STATIONS_PATH), else the built-in summary."""
+    path = path or os.environ.get(STATIONS_PATH_ENV)
+    start = time.perf_counter()
+    if not path:
+        states = pd.DataFrame(BUILTIN_STATES).set_index('State')
+        stats = LoadStats('builtin', len(states), time.perf_counter() - start,
+                          float(states.memory_usage(deep=True).sum()) / 2**20, _rss_mb())
+        return Dataset(states, stats=stats)
+
+    stations = read_stations(path)
+    codes = stations['State'].cat.codes.to_numpy()
+    if np.any(codes[1:] < codes[:-1]):
+        stations = stations.sort_values(['State', 'Constituency'], kind='stable', ignore_index=True)
+    states = _rollup(stations, ['State'])
+    constituencies = _rollup(stations, ['State', 'Constituency'])
+    stats = LoadStats(path, len(stations), time.perf_counter() - start,
+                      float(stations.memory_usage(deep=True).sum()) / 2**20, _rss_mb())
+    return Dataset(states, stations, constituencies, stats)
+
+
+def synthetic_stations(n_rows, n_states=36, constituencies_per_state=80, seed=0):
+    """Random station-level table with a realistic shape, for benchmarks and demos."""
+    rng = np.random.default_rng(seed)
+    weights = rng.pareto(1.5, n_states) + 1.0
+    state_idx = np.sort(rng.choice(n_states, size=n_rows, p=weights / weights.sum()))
+    const_idx = rng.integers(0, constituencies_per_state, size=n_rows)
+    electors = rng.integers(400, 1500, size=n_rows).astype(np.int32)
+    turnout = np.clip(rng.normal(0.65, 0.08, size=n_rows), 0.3, 0.95)
+    state_names = np.array([f'State {i:02d}' for i in range(n_states)])
+    const_names = np.array([f'AC {i:03d}' for i in range(constituencies_per_state)])
+    return pd.DataFrame({
+        'State': pd.Categorical(state_names[state_idx], categories=state_names),
+        'Constituency': pd.Categorical(
+            np.char.add(np.char.add(state_names[state_idx], ' / '), const_names[const_idx])),
+        'Polling Station': np.arange(n_rows, dtype=np.int32),
+        'Electors': electors,
+        'Votes Polled': (electors * turnout).astype(np.int32),
+        'Est. Election Cost (₹ Cr)': (electors * rng.uniform(2.0e-5, 4.0e-5, size=n_rows)).astype(np.float32),
+    })
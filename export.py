@@ -0,0 +1,100 @@
+"""Report export for the Impact Simulator.
+
+Builds the simulation result, parameter and full-grid tables and encodes them
+as XLSX (openpyxl write-only mode), CSV or Parquet. Encoded reports are kept
+in a content-addressed byte cache shared across sessions, so identical
+requests are served without re-encoding.
+"""
+import hashlib
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+
+from caching import BytesLRUCache
+
+EXPORT_CACHE_BYTES = 64 * 1024 * 1024
+FORMATS = {
+    # fmt: (label, file extension, mime type)
+    'xlsx': ('Excel', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('CSV', 'zip', 'application/zip'),
+    'parquet': ('Parquet', 'zip', 'application/zip'),
+}
+
+
+def build_tables(df, grid, state, impact, all_states=False):
+    """Collect the tables that make up a simulation report.
+
+    With ``all_states`` the report covers every state and ``state`` is ignored.
+    """
+    comparison = grid.compare_states(impact)
+    if not all_states:
+        comparison = comparison[comparison['State'] == state]
+    parameters = pd.DataFrame({
+        'Parameter': ['State', 'Projected Turnout Change (%)', 'Scope'],
+        'Value': ['All states' if all_states else state, str(impact),
+                  'All states' if all_states else 'Selected state'],
+    })
+    grid_frame = grid.to_frame()
+    if not all_states:
+        grid_frame = grid_frame[grid_frame['State'] == state]
+    return {
+        'Simulation': comparison.reset_index(drop=True),
+        'Parameters': parameters,
+        'Scenario Grid': grid_frame.reset_index(drop=True),
+        'Input Data': df,
+    }
+
+
+def content_key(tables, fmt):
+    """Content address of a report: same tables + format -> same key."""
+    h = hashlib.sha256(fmt.encode())
+    for name, table in tables.items():
+        h.update(name.encode())
+        h.update('\x1f'.join(map(str, table.columns)).encode())
+        h.update(pd.util.hash_pandas_object(table, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _to_xlsx(tables):
+    from openpyxl import Workbook
+
+    # Write-only mode streams rows instead of keeping a cell object per value.
+    wb = Workbook(write_only=True)
+    for name, table in tables.items():
+        ws = wb.create_sheet(title=name[:31])
+        ws.append([str(c) for c in table.columns])
+        for row in table.itertuples(index=False, name=None):
+            ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def _to_zip(tables, ext, write):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, table in tables.items():
+            member = BytesIO()
+            write(table, member)
+            zf.writestr(f"{name.lower().replace(' ', '_')}.{ext}", member.getvalue())
+    return buf.getvalue()
+
+
+def encode_report(tables, fmt):
+    if fmt == 'xlsx':
+        return _to_xlsx(tables)
+    if fmt == 'csv':
+        return _to_zip(tables, 'csv', lambda t, f: t.to_csv(f, index=False))
+    if fmt == 'parquet':
+        return _to_zip(tables, 'parquet', lambda t, f: t.to_parquet(f, index=False))
+    raise ValueError(f"Unsupported export format: {fmt!r}")
+
+
+class ReportExporter:
+    def __init__(self, max_bytes=EXPORT_CACHE_BYTES):
+        self.cache = BytesLRUCache(max_bytes)
+
+    def export(self, tables, fmt):
+        key = content_key(tables, fmt)
+        return self.cache.get_or_create(key, lambda: encode_report(tables, fmt))
@@ -0,0 +1,246 @@
+"""Misinformation-report ingestion with near-duplicate detection.
+
+Uploads are streamed to disk in fixed-size chunks under a size cap and
+named by their SHA-256, so byte-identical copies are stored once. Each new
+file gets a 64-bit difference hash (dHash), computed in the uploading
+script's thread once the file is on disk (Pillow decodes at reduced scale,
+so this takes milliseconds).
+Near-duplicates are found with multi-index hashing: the hash is split into
+four 16-bit segments, each indexed in SQLite. Two hashes within Hamming
+distance 3 must agree exactly on at least one segment (pigeonhole), so a
+lookup is four indexed probes plus a popcount over the few candidates.
+Moderators see one row per unique image with its report count.
+
+Images are checked against a pixel cap from their header, before any pixel
+data is decoded; anything oversized or undecodable is rejected and its file
+removed again.
+"""
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+REPORTS_DIR_ENV = 'ONOE_REPORTS_DIR'
+DEFAULT_REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'var', 'reports')
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+HASH_SIZE = 8            # 8x8 gradient bits -> 64-bit hash
+SEGMENTS = 4             # 4 x 16-bit segments
+MAX_DISTANCE = SEGMENTS - 1  # largest radius the pigeonhole lookup is exact for
+MAX_IMAGE_PIXELS = 40_000_000  # ~6300 x 6300; far beyond any screenshot
+PREVIEW_SIZE = 160
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    phash INTEGER NOT NULL,
+    seg0 INTEGER NOT NULL,
+    seg1 INTEGER NOT NULL,
+    seg2 INTEGER NOT NULL,
+    seg3 INTEGER NOT NULL,
+    reports INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    sample_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_seg0 ON images (seg0);
+CREATE INDEX IF NOT EXISTS images_seg1 ON images (seg1);
+CREATE INDEX IF NOT EXISTS images_seg2 ON images (seg2);
+CREATE INDEX IF NOT EXISTS images_seg3 ON images (seg3);
+CREATE TABLE IF NOT EXISTS files (
+    sha256 TEXT PRIMARY KEY,
+    image_id INTEGER NOT NULL REFERENCES images (id)
+);
+"""
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class UnreadableImage(ValueError):
+    pass
+
+
+def stream_to_disk(fileobj, dest_dir, max_bytes=MAX_UPLOAD_BYTES, chunk_bytes=CHUNK_BYTES, suffix=''):
+    """Copy ``fileobj`` to ``dest_dir`` chunk by chunk; returns (path, sha256, size)."""
+    os.makedirs(dest_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = os.path.join(dest_dir, f'.upload-{threading.get_ident()}-{time.monotonic_ns()}')
+    try:
+        with open(tmp_path, 'wb') as out:
+            while True:
+                chunk = fileobj.read(chunk_bytes)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Upload exceeds {max_bytes // (1024 * 1024)} MB")
+                digest.update(chunk)
+                out.write(chunk)
+        sha = digest.hexdigest()
+        path = os.path.join(dest_dir, sha[:2], sha + suffix)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        return path, sha, size
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _open_image(path, max_pixels=MAX_IMAGE_PIXELS):
+    """Open an image lazily, rejecting it by its header size before any decode."""
+    from PIL import Image
+
+    try:
+        img = Image.open(path)
+    except (OSError, Image.DecompressionBombError) as e:
+        raise UnreadableImage(str(e)) from e
+    width, height = img.size
+    if width * height > max_pixels:
+        img.close()
+        raise UnreadableImage(f"Image is {width}x{height} pixels, over the {max_pixels:,} pixel limit")
+    return img
+
+
+def load_thumbnail(path, size=HASH_SIZE):
+    """Decode an image straight to a (size, size + 1) grayscale array."""
+    from PIL import Image
+
+    with _open_image(path) as img:
+        try:
+            img.draft('L', (size * 8, size * 8))  # JPEG: decode at reduced scale
+            return np.asarray(img.convert('L').resize((size + 1, size), Image.Resampling.LANCZOS), dtype=np.int16)
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError) as e:
+            raise UnreadableImage(str(e)) from e
+
+
+def preview(path, size=PREVIEW_SIZE):
+    """A small PNG of a stored image, for the moderator view."""
+    with _open_image(path) as img:
+        img.draft('RGB', (size, size))
+        img.thumbnail((size, size))
+        out = io.BytesIO()
+        img.convert('RGB').save(out, format='PNG')
+        return out.getvalue()
+
+
+def dhash_batch(thumbs):
+    """Difference hashes for a stack of (N, H, H + 1) thumbnails, as uint64."""
+    thumbs = np.asarray(thumbs)
+    bits = (thumbs[:, :, 1:] > thumbs[:, :, :-1]).reshape(len(thumbs), -1)
+    weights = np.left_shift(np.uint64(1), np.arange(bits.shape[1], dtype=np.uint64))
+    return (bits.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+
+def dhash(path):
+    return int(dhash_batch(load_thumbnail(path)[None])[0])
+
+
+def segments(h):
+    return [(h >> (16 * i)) & 0xFFFF for i in range(SEGMENTS)]
+
+
+def _to_signed(h):
+    # SQLite integers are signed 64-bit.
+    return h - (1 << 64) if h >= 1 << 63 else h
+
+
+def _to_unsigned(h):
+    return h + (1 << 64) if h < 0 else h
+
+
+class ReportIngestor:
+    def __init__(self, root=None, max_distance=MAX_DISTANCE):
+        self.root = root or os.environ.get(REPORTS_DIR_ENV, DEFAULT_REPORTS_DIR)
+        os.makedirs(self.root, exist_ok=True)
+        self.max_distance = min(max_distance, MAX_DISTANCE)
+        self._conn = sqlite3.connect(os.path.join(self.root, 'index.db'), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def find_similar(self, h):
+        """Nearest indexed image within ``max_distance`` bits: (image_id, distance) or None."""
+        rows = self._conn.execute(
+            'SELECT id, phash FROM images WHERE seg0 = ? OR seg1 = ? OR seg2 = ? OR seg3 = ?',
+            segments(h),
+        ).fetchall()
+        best = None
+        for image_id, other in rows:
+            distance = bin(h ^ _to_unsigned(other)).count("1")
+            if distance <= self.max_distance and (best is None or distance < best[1]):
+                best = (image_id, distance)
+        return best
+
+    def ingest(self, fileobj, suffix=''):
+        """Store one upload and fold it into its near-duplicate cluster.
+
+        Returns a dict with the cluster's ``image_id``, its ``reports`` count,
+        whether the image is ``new`` and the Hamming ``distance`` it matched at.
+        """
+        path, sha, _ = stream_to_disk(fileobj, os.path.join(self.root, 'files'), suffix=suffix)
+        now = time.time()
+
+        with self._lock:
+            known = self._conn.execute('SELECT image_id FROM files WHERE sha256 = ?', (sha,)).fetchone()
+        if known is not None:
+            # Byte-identical copy: no need to decode or hash again.
+            return self._bump(known[0], now, distance=0)
+
+        try:
+            h = dhash(path)
+        except UnreadableImage:
+            # Not an image we can index: keep nothing on disk for it. (No
+            # files row points here, so no earlier report uses this file.)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            raise
+        with self._lock, self._conn:
+            match = self.find_similar(h)
+            if match is not None:
+                image_id, distance = match
+                self._conn.execute('INSERT OR IGNORE INTO files (sha256, image_id) VALUES (?, ?)', (sha, image_id))
+            else:
+                cur = self._conn.execute(
+                    'INSERT INTO images (phash, seg0, seg1, seg2, seg3, reports, first_seen, last_seen, sample_path) '
+                    'VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?)',
+                    [_to_signed(h), *segments(h), now, now, path],
+                )
+                image_id, distance = cur.lastrowid, None
+                self._conn.execute('INSERT INTO files (sha256, image_id) VALUES (?, ?)', (sha, image_id))
+        result = self._bump(image_id, now, distance)
+        result['new'] = distance is None
+        return result
+
+    def _bump(self, image_id, now, distance):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE images SET reports = reports + 1, last_seen = ? WHERE id = ?', (now, image_id))
+            reports = self._conn.execute('SELECT reports FROM images WHERE id = ?', (image_id,)).fetchone()[0]
+        return {'image_id': image_id, 'reports': reports, 'new': False, 'distance': distance}
+
+    def top_images(self, limit=20):
+        """Unique images ordered by report count, for the moderator view."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, phash, reports, first_seen, last_seen, sample_path FROM images '
+                'ORDER BY reports DESC, last_seen DESC LIMIT ?', (limit,),
+            ).fetchall()
+        return [
+            {'image_id': i, 'hash': f'{_to_unsigned(h):016x}', 'reports': n,
+             'first_seen': first, 'last_seen': last, 'sample_path': path}
+            for i, h, n, first, last, path in rows
+        ]
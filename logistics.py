@@ -0,0 +1,122 @@
+"""EVM, VVPAT, polling-staff and security requirements per state and phase.
+
+Requirements are derived from polling-station counts and electors. With
+station-level data every station is counted individually, and a state's
+constituencies are spread over its polling phases. With the built-in
+summary each state's stations are split evenly. In both cases the
+per-station norms are applied to a small (state x phase) table.
+
+The expensive part is reducing stations to (state, phase) aggregates, and it
+depends only on how many phases each state polls in. Those aggregates are
+cached per (state, phase count) and shared across sessions, so changing one
+state's phases re-reduces only that state's contiguous slice of stations.
+Every other parameter is a vectorized formula over the cached table.
+"""
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+BALLOT_UNIT_CANDIDATES = 16     # candidates (incl. NOTA) per ballot unit
+PARTY_SIZE = 4                  # presiding officer + three polling officers
+EXTRA_OFFICER_PER_POLL = 1      # per additional simultaneous poll at a station
+LARGE_STATION_ELECTORS = 1200   # stations above this get one more officer
+POLICE_PER_STATION = 2
+CAPF_PER_SENSITIVE_STATION = 4
+MAX_STATE_PHASES = 7
+
+
+@dataclass(frozen=True)
+class LogisticsParams:
+    polls: int = 2                  # simultaneous polls (Lok Sabha + assembly)
+    candidates: int = 15            # contesting candidates per constituency, incl. NOTA
+    bu_reserve: float = 0.30        # reserve ballot units
+    cu_reserve: float = 0.25        # reserve control units
+    vvpat_reserve: float = 0.35     # reserve VVPATs
+    staff_reserve: float = 0.20     # reserve polling parties
+    sensitive_share: float = 0.15   # share of stations needing armed police
+
+
+@dataclass(frozen=True)
+class Requirements:
+    by_phase: pd.DataFrame    # one row per (state, phase)
+    by_state: pd.DataFrame    # machines summed over phases, people at the busiest phase
+    national: dict
+
+
+class LogisticsModel:
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.states = list(dataset.states.index)
+        self._aggregates = {}
+        self._lock = threading.Lock()
+        self.reductions = 0
+
+    def _reduce(self, state, n_phases):
+        """(stations, electors, large stations) per phase for one state."""
+        if self.dataset.stations is None:
+            row = self.dataset.state(state)
+            stations = int(row['Polling Stations'])
+            per_phase = np.full(n_phases, stations // n_phases, dtype=np.int64)
+            per_phase[:stations % n_phases] += 1
+            electors = per_phase * (row['Voters (Cr)'] * 1e7 / max(stations, 1))
+            large = per_phase * (row['Voters (Cr)'] * 1e7 / max(stations, 1) > LARGE_STATION_ELECTORS)
+            return np.stack([per_phase, electors.round(), large]).astype(np.int64)
+
+        slice_ = self.dataset.stations_for(state)
+        phase = slice_['Constituency'].cat.codes.to_numpy() % n_phases
+        electors = slice_['Electors'].to_numpy()
+        return np.stack([
+            np.bincount(phase, minlength=n_phases),
+            np.bincount(phase, weights=electors, minlength=n_phases).astype(np.int64),
+            np.bincount(phase, weights=electors > LARGE_STATION_ELECTORS, minlength=n_phases).astype(np.int64),
+        ])
+
+    def phase_aggregates(self, state, n_phases):
+        key = (state, int(n_phases))
+        agg = self._aggregates.get(key)
+        if agg is None:
+            agg = self._reduce(state, key[1])
+            with self._lock:
+                agg = self._aggregates.setdefault(key, agg)
+                self.reductions += 1
+        return agg
+
+    def requirements(self, params=LogisticsParams(), phases=None):
+        """Requirements for every state; ``phases`` maps state -> phase count (default 1)."""
+        phases = phases or {}
+        parts = [(state, self.phase_aggregates(state, phases.get(state, 1))) for state in self.states]
+        state_col = np.concatenate([[state] * agg.shape[1] for state, agg in parts])
+        phase_col = np.concatenate([np.arange(1, agg.shape[1] + 1) for _, agg in parts])
+        stations, electors, large = np.concatenate([agg for _, agg in parts], axis=1)
+
+        bu_per_station = -(-params.candidates // BALLOT_UNIT_CANDIDATES)
+        sets = stations * params.polls
+        staff_per_station = PARTY_SIZE + (params.polls - 1) * EXTRA_OFFICER_PER_POLL
+        by_phase = pd.DataFrame({
+            'State': state_col,
+            'Phase': phase_col,
+            'Polling Stations': stations,
+            'Electors': electors,
+            'Ballot Units': np.ceil(sets * bu_per_station * (1 + params.bu_reserve)).astype(np.int64),
+            'Control Units': np.ceil(sets * (1 + params.cu_reserve)).astype(np.int64),
+            'VVPATs': np.ceil(sets * (1 + params.vvpat_reserve)).astype(np.int64),
+            'Polling Staff': np.ceil((stations * staff_per_station + large) * (1 + params.staff_reserve)).astype(np.int64),
+            'Security Personnel': np.ceil(
+                stations * (POLICE_PER_STATION + params.sensitive_share * CAPF_PER_SENSITIVE_STATION)).astype(np.int64),
+        })
+
+        # Machines stay sealed in strongrooms until counting, so they add up
+        # over phases; staff and security move on, so the busiest phase counts.
+        machines = ['Polling Stations', 'Electors', 'Ballot Units', 'Control Units', 'VVPATs']
+        people = ['Polling Staff', 'Security Personnel']
+        grouped = by_phase.groupby('State', sort=False)
+        by_state = grouped[machines].sum().join(grouped[people].max()).join(grouped['Phase'].max().rename('Phases'))
+        by_state = by_state.reset_index()
+
+        national = {col: int(by_phase[col].sum()) for col in machines}
+        peak = by_phase.groupby('Phase')[people].sum()
+        national.update({col: int(peak[col].max()) for col in people})
+        national['Phases'] = int(by_phase['Phase'].max())
+        return Requirements(by_phase, by_state, national)
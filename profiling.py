@@ -0,0 +1,252 @@
+"""Per-rerun timing and session-state size tracking.
+
+``begin_run``/``end_run`` bracket one script run and ``timed(section)``
+marks the hot sections inside it. Fragment reruns are bracketed by the
+``profiled`` decorator. Each finished run is folded into a process-wide
+``MetricsStore`` of recent samples per (page, section), which reports
+p50/p95/p99. Runs can also be exported:
+
+* ``$ONOE_METRICS_LOG``: one JSON line per run (structured log).
+* ``$ONOE_METRICS_TEXTFILE``: Prometheus text format, rewritten at most every
+  few seconds, for node_exporter's textfile collector.
+
+Nothing here imports Streamlit; the debug panel lives in views/debug_panel.py.
+"""
+import functools
+import hmac
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+METRICS_LOG_ENV = 'ONOE_METRICS_LOG'
+METRICS_TEXTFILE_ENV = 'ONOE_METRICS_TEXTFILE'
+DEBUG_ENV = 'ONOE_DEBUG'
+DEBUG_TOKEN_ENV = 'ONOE_DEBUG_TOKEN'
+
+WINDOW = 2048             # recent samples kept per (page, section)
+QUANTILES = (50, 95, 99)
+TEXTFILE_INTERVAL = 10.0  # seconds between textfile rewrites
+TOTAL = 'total'
+BACKGROUND = 'background'  # sections timed outside any script run (e.g. download callbacks)
+
+logger = logging.getLogger('onoe.metrics')
+_local = threading.local()
+
+
+@dataclass
+class Run:
+    page: str = ''
+    start: float = field(default_factory=time.perf_counter)
+    sections: list = field(default_factory=list)   # [(section, seconds)] in order
+    total: float = 0.0
+    session_state_bytes: int = 0
+
+
+def deep_size(obj, _seen=None):
+    """Approximate retained size of ``obj`` in bytes, following containers."""
+    _seen = set() if _seen is None else _seen
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes + sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_size(k, _seen) + deep_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(v, _seen) for v in obj)
+    return size
+
+
+def percentiles(values, qs=QUANTILES):
+    """Linear-interpolated percentiles (numpy's default) of a non-empty sequence."""
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    out = []
+    for q in qs:
+        pos = last * q / 100
+        lo = int(pos)
+        hi = min(lo + 1, last)
+        out.append(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+    return out
+
+
+class MetricsStore:
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))  # (page, section) -> seconds
+        self._counts = defaultdict(int)
+        self._sums = defaultdict(float)
+        self._state_bytes = defaultdict(lambda: deque(maxlen=self.window))  # page -> bytes
+        self._lock = threading.Lock()
+        self._textfile_written = 0.0
+
+    def record(self, page, section, seconds):
+        with self._lock:
+            self._samples[(page, section)].append(seconds)
+            self._counts[(page, section)] += 1
+            self._sums[(page, section)] += seconds
+
+    def record_run(self, run):
+        with self._lock:
+            for section, seconds in run.sections + [(TOTAL, run.total)]:
+                self._samples[(run.page, section)].append(seconds)
+                self._counts[(run.page, section)] += 1
+                self._sums[(run.page, section)] += seconds
+            self._state_bytes[run.page].append(run.session_state_bytes)
+
+    def summary(self):
+        """Rows of page, section, count and p50/p95/p99/max in milliseconds."""
+        with self._lock:
+            samples = {key: list(values) for key, values in self._samples.items()}
+            counts = dict(self._counts)
+        rows = []
+        for (page, section), values in sorted(samples.items()):
+            rows.append({'page': page, 'section': section, 'count': counts[(page, section)],
+                         **{f'p{q}_ms': round(v * 1000, 2) for q, v in zip(QUANTILES, percentiles(values))},
+                         'max_ms': round(max(values) * 1000, 2)})
+        return rows
+
+    def session_state_summary(self):
+        with self._lock:
+            samples = {page: list(values) for page, values in self._state_bytes.items()}
+        return [{'page': page, **{f'p{q}_kb': round(v / 1024, 1) for q, v in zip(QUANTILES, percentiles(values))}}
+                for page, values in sorted(samples.items())]
+
+    def prometheus(self):
+        """Prometheus text exposition of the current window."""
+        lines = [
+            '# HELP onoe_rerun_seconds Script rerun time by page and section.',
+            '# TYPE onoe_rerun_seconds summary',
+        ]
+        with self._lock:
+            samples = {key: list(values) for key, values in self._samples.items()}
+            counts, sums = dict(self._counts), dict(self._sums)
+            state = {page: list(values) for page, values in self._state_bytes.items()}
+        for (page, section), values in sorted(samples.items()):
+            labels = f'page="{page}",section="{section}"'
+            for q, v in zip(QUANTILES, percentiles(values)):
+                lines.append(f'onoe_rerun_seconds{{{labels},quantile="{q / 100}"}} {v:.6f}')
+            lines.append(f'onoe_rerun_seconds_sum{{{labels}}} {sums[(page, section)]:.6f}')
+            lines.append(f'onoe_rerun_seconds_count{{{labels}}} {counts[(page, section)]}')
+        lines += [
+            '# HELP onoe_session_state_bytes Approximate session-state size at the end of a rerun.',
+            '# TYPE onoe_session_state_bytes summary',
+        ]
+        for page, values in sorted(state.items()):
+            for q, v in zip(QUANTILES, percentiles(values)):
+                lines.append(f'onoe_session_state_bytes{{page="{page}",quantile="{q / 100}"}} {v:.0f}')
+        return '\n'.join(lines) + '\n'
+
+    def maybe_write_textfile(self, path, interval=TEXTFILE_INTERVAL):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._textfile_written < interval:
+                return
+            self._textfile_written = now
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus())
+        os.replace(tmp_path, path)
+
+
+metrics = MetricsStore()
+
+
+def _configure_log():
+    path = os.environ.get(METRICS_LOG_ENV)
+    if path and not logger.handlers:
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+_configure_log()
+
+
+def debug_enabled(query_params=None):
+    """Debug panel switch: $ONOE_DEBUG=1, or ?debug=<token> matching $ONOE_DEBUG_TOKEN.
+
+    Without either, the URL alone never opens the panel.
+    """
+    if os.environ.get(DEBUG_ENV) == '1':
+        return True
+    token = os.environ.get(DEBUG_TOKEN_ENV)
+    if not token or query_params is None:
+        return False
+    return hmac.compare_digest(query_params.get('debug', '').encode(), token.encode())
+
+
+def current_run():
+    return getattr(_local, 'run', None)
+
+
+def begin_run():
+    _local.run = Run()
+    return _local.run
+
+
+def end_run(page, session_state=None):
+    """Finish the current run: measure session state, record and export it."""
+    run = current_run()
+    if run is None:
+        return None
+    _local.run = None
+    run.page = page
+    run.total = time.perf_counter() - run.start
+    if session_state is not None:
+        run.session_state_bytes = deep_size(dict(session_state.items()))
+    metrics.record_run(run)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            'ts': round(time.time(), 3), 'page': page, 'total_ms': round(run.total * 1000, 2),
+            'sections': {name: round(seconds * 1000, 2) for name, seconds in run.sections},
+            'session_state_bytes': run.session_state_bytes,
+        }))
+    textfile = os.environ.get(METRICS_TEXTFILE_ENV)
+    if textfile:
+        metrics.maybe_write_textfile(textfile)
+    return run
+
+
+@contextmanager
+def timed(section):
+    """Time a block as one section of the current run (or on its own if none)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        run = current_run()
+        if run is not None:
+            run.sections.append((section, elapsed))
+        else:
+            metrics.record(BACKGROUND, section, elapsed)
+
+
+def profiled(page, session_state=None):
+    """Time a fragment: a section of a full run, or a run of its own on fragment reruns."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if current_run() is not None:
+                with timed(fn.__name__.lstrip('_')):
+                    return fn(*args, **kwargs)
+            begin_run()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end_run(f'{page}:{fn.__name__.lstrip("_")}', session_state)
+        return wrapper
+    return decorate
@@ -0,0 +1,122 @@
+"""Process-wide cached resources shared by the page modules.
+
+Each getter imports its backing module on first use, so a session that never
+opens the simulator never pays for pandas, matplotlib or openpyxl.
+"""
+import streamlit as st
+
+
+@st.cache_resource
+def get_stylesheet():
+    # Read from static/ once per process, not kept as a literal in the script.
+    from assets import stylesheet
+    return stylesheet()
+
+
+@st.cache_resource
+def get_logo_url():
+    # Served from static/ by this app, versioned by content hash, once
+    # `python assets.py` has fetched it; the original URL until then.
+    from assets import logo_url
+    return logo_url()
+
+
+@st.cache_resource
+def get_content_store():
+    # One translation catalog per process; language packs load on first use,
+    # frozen (read-only, interned) and shared by every session, with
+    # least-recently-used eviction.
+    from content_store import ContentStore
+    return ContentStore()
+
+
+@st.cache_resource
+def get_dataset():
+    # Station-level data ($ONOE_STATIONS_PATH) is memory-mapped and rolled up
+    # once per process; without it the built-in state summary is used.
+    from data_store import open_dataset
+    return open_dataset()
+
+
+@st.cache_data
+def load_data():
+    return get_dataset().state_frame()
+
+
+@st.cache_data
+def load_scenario_grid(df):
+    # Keyed on the content of the data frame, so the grid is rebuilt only
+    # when the input data changes, not on every slider move.
+    from simulation import build_scenario_grid
+    return build_scenario_grid(df)
+
+
+@st.cache_data(max_entries=64)
+def load_uncertainty(df, impact, n_samples, seed, national):
+    # Cached by seed + parameters: the same draw is never sampled twice.
+    from uncertainty import run_monte_carlo
+    return run_monte_carlo(
+        df['State'], df['Est. Election Cost (₹ Cr)'], df['Turnout (%)'], df['Voters (Cr)'],
+        impact, n_samples, seed=seed, national=national,
+    )
+
+
+@st.cache_resource
+def get_chart_renderer():
+    # One rendered-chart LRU per process, shared by every session.
+    from charts import ChartRenderer
+    return ChartRenderer()
+
+
+@st.cache_resource
+def get_report_exporter():
+    # Content-addressed report bytes, shared by every session.
+    from export import ReportExporter
+    return ReportExporter()
+
+
+@st.cache_resource
+def get_fact_index(version, _facts):
+    # Built once per fact-base version and shared by every session.
+    from search import FactIndex
+    return FactIndex(_facts)
+
+
+@st.cache_resource
+def get_submission_sink():
+    # One buffered SQLite writer per process, shared by every session.
+    from submissions import SubmissionSink
+    return SubmissionSink()
+
+
+@st.cache_data(ttl=5)
+def load_quiz_aggregates(quiz_version):
+    return get_submission_sink().aggregates(quiz_version)
+
+
+@st.cache_resource
+def get_report_ingestor():
+    # Shared upload store and near-duplicate index.
+    from ingestion import ReportIngestor
+    return ReportIngestor()
+
+
+@st.cache_data(max_entries=64)
+def load_report_preview(path):
+    # Small PNG of a reported image; the originals can be megabytes each.
+    from ingestion import preview
+    return preview(path)
+
+
+@st.cache_data
+def load_legislatures():
+    # Term-end dates and election costs for the calendar optimizer.
+    import calendar_sync
+    return calendar_sync.load_legislatures()
+
+
+@st.cache_resource
+def get_logistics_model():
+    # Per-(state, phase count) station aggregates, shared by every session.
+    from logistics import LogisticsModel
+    return LogisticsModel(get_dataset())
@@ -0,0 +1,169 @@
+"""Full-text search for the Myth Buster.
+
+A precomputed inverted index over the fact base with normalized tokens
+(NFKC + casefold, Devanagari-aware), prefix matching, single-edit typo
+tolerance and BM25 ranking. The index is immutable once built, so a single
+instance can be shared by every session.
+"""
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+
+# Devanagari vowel signs are combining marks, which ``\w`` alone splits on.
+_TOKEN_RE = re.compile(r"[\w\u0900-\u097F]+")
+
+# Field weights: a hit in the topic key or the myth counts more than one in
+# the fact text or the source line.
+FIELD_WEIGHTS = {'key': 3.0, 'myth': 2.0, 'fact': 1.0, 'source': 0.5}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_WEIGHT = 0.8     # score factor for a prefix expansion
+TYPO_WEIGHT = 0.6       # score factor for a one-edit match
+MIN_PREFIX_LEN = 2
+MIN_TYPO_LEN = 4
+MAX_EXPANSIONS = 64     # vocabulary terms tried per query token
+
+
+def normalize(text):
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a, b):
+    # Levenshtein distance <= 1, plus adjacent transpositions.
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    i = 0
+    while i < la and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        return a[i + 1:] == b[i + 1:] or (
+            i + 1 < la and a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:])
+    return a[i:] == b[i + 1:]
+
+
+class FactIndex:
+    def __init__(self, facts):
+        self.keys = list(facts)
+        n_docs = len(self.keys)
+
+        # Collect (term, doc, weight) triples, then reduce them to CSR postings.
+        term_ids = {}
+        triple_terms, triple_docs, triple_weights = [], [], []
+        for doc_id, key in enumerate(self.keys):
+            entry = facts[key]
+            fields = {'key': key, 'myth': entry['myth'], 'fact': entry['fact'], 'source': entry['source']}
+            for field, text in fields.items():
+                tokens = tokenize(text)
+                triple_terms.extend(term_ids.setdefault(token, len(term_ids)) for token in tokens)
+                triple_docs.extend([doc_id] * len(tokens))
+                triple_weights.extend([FIELD_WEIGHTS[field]] * len(tokens))
+
+        # Renumber terms in sorted order so prefix lookups can bisect the vocabulary.
+        self.vocab = sorted(term_ids)
+        self._term_ids = {term: i for i, term in enumerate(self.vocab)}
+        remap = np.fromiter((self._term_ids[term] for term in term_ids), dtype=np.int64, count=len(term_ids))
+        terms = remap[np.asarray(triple_terms, dtype=np.int64)]
+        docs = np.asarray(triple_docs, dtype=np.int64)
+        weights = np.asarray(triple_weights, dtype=np.float32)
+        doc_len = np.bincount(docs, weights=weights, minlength=n_docs).astype(np.float32)
+
+        # Sum the field weights of repeated (term, doc) pairs.
+        pair = terms * max(n_docs, 1) + docs
+        order = np.argsort(pair, kind='stable')
+        pair = pair[order]
+        starts = np.flatnonzero(np.diff(pair, prepend=-1))
+        self._tf = np.add.reduceat(weights[order], starts) if pair.size else weights
+        self._doc_ids = docs[order][starts].astype(np.int32)
+        self._offsets = np.searchsorted(terms[order][starts], np.arange(len(self.vocab) + 1))
+
+        doc_freq = np.diff(self._offsets)
+        self._idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+
+        avg_len = float(doc_len.mean()) if n_docs else 1.0
+        self._norm = (BM25_K1 * (1.0 - BM25_B + BM25_B * doc_len / max(avg_len, 1e-9))).astype(np.float32)
+
+        # Deletion neighbourhood (SymSpell style) for one-edit typo lookups.
+        self._deletes = defaultdict(list)
+        for i, term in enumerate(self.vocab):
+            if len(term) >= MIN_TYPO_LEN:
+                for variant in _deletes(term):
+                    self._deletes[variant].append(i)
+        self._deletes = dict(self._deletes)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _prefix_terms(self, token):
+        start = bisect_left(self.vocab, token)
+        out = []
+        for i in range(start, min(start + MAX_EXPANSIONS + 1, len(self.vocab))):
+            if not self.vocab[i].startswith(token):
+                break
+            out.append(i)
+        return out
+
+    def _typo_terms(self, token):
+        candidates = set()
+        term_id = self._term_ids.get
+        for variant in _deletes(token) | {token}:
+            i = term_id(variant)
+            if i is not None:
+                candidates.add(i)
+            candidates.update(self._deletes.get(variant, ()))
+        return [i for i in candidates if _within_one_edit(token, self.vocab[i])][:MAX_EXPANSIONS]
+
+    def _expand(self, token):
+        """Vocabulary terms matched by one query token, with score factors."""
+        matches = {}
+        exact = self._term_ids.get(token)
+        if exact is not None:
+            matches[exact] = 1.0
+        if len(token) >= MIN_PREFIX_LEN:
+            for i in self._prefix_terms(token):
+                matches.setdefault(i, PREFIX_WEIGHT)
+        if not matches and len(token) >= MIN_TYPO_LEN:
+            for i in self._typo_terms(token):
+                matches.setdefault(i, TYPO_WEIGHT)
+        return matches
+
+    def search(self, query, limit=None):
+        """Return fact keys ranked by relevance; an empty query returns all."""
+        tokens = tokenize(query)
+        if not tokens:
+            return self.keys[:limit] if limit else list(self.keys)
+
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        for token in dict.fromkeys(tokens):
+            token_scores = np.zeros_like(scores)
+            for term, factor in self._expand(token).items():
+                lo, hi = self._offsets[term], self._offsets[term + 1]
+                ids = self._doc_ids[lo:hi]
+                tf = self._tf[lo:hi]
+                contrib = factor * self._idf[term] * tf * (BM25_K1 + 1.0) / (tf + self._norm[ids])
+                token_scores[ids] = np.maximum(token_scores[ids], contrib)
+            scores += token_scores
+
+        hits = np.flatnonzero(scores)
+        if limit and len(hits) > limit:
+            hits = np.sort(hits[np.argpartition(-scores[hits], limit - 1)[:limit]])
+        # Stable sort keeps the original fact order among equal scores.
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
+        return [self.keys[i] for i in hits]
+
@@ -0,0 +1,97 @@
+"""Scenario-grid engine for the Impact Simulator.
+
+Every (state, turnout change) combination the simulator controls can reach
+is evaluated in a single vectorized NumPy pass, so the UI only has to index
+into the precomputed arrays. The 5-year cost model does not depend on how
+often elections are held today, so there is no frequency axis.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Slider domains (shared by the simulator widgets and the batch runner)
+TURNOUT_MIN, TURNOUT_MAX, TURNOUT_DEFAULT = -10, 20, 5
+
+# Simple Model: Cost over 5 years
+CURRENT_COST_FACTOR = 1.5   # Approx separate elections cost more
+ONOE_COST_FACTOR = 1.1      # One time sync cost
+
+
+@dataclass(frozen=True)
+class ScenarioGrid:
+    states: tuple
+    impacts: np.ndarray          # (I,)
+    base_cost: np.ndarray        # (S,)
+    base_turnout: np.ndarray     # (S,)
+    cost_current_5yr: np.ndarray  # (S,)
+    cost_onoe_5yr: np.ndarray    # (S,)
+    savings: np.ndarray          # (S,)
+    turnout: np.ndarray          # (S, I)
+
+    def state_index(self, state):
+        return self.states.index(state)
+
+    def lookup(self, state, impact):
+        """Return the scalar results for one slider position."""
+        s = self.state_index(state)
+        i = int(impact) - TURNOUT_MIN
+        return {
+            'state': state,
+            'base_cost': float(self.base_cost[s]),
+            'cost_current_5yr': float(self.cost_current_5yr[s]),
+            'cost_onoe_5yr': float(self.cost_onoe_5yr[s]),
+            'savings': float(self.savings[s]),
+            'base_turnout': float(self.base_turnout[s]),
+            'turnout': float(self.turnout[s, i]),
+        }
+
+    def compare_states(self, impact):
+        """All-states comparison table for one slider position."""
+        i = int(impact) - TURNOUT_MIN
+        return pd.DataFrame({
+            'State': list(self.states),
+            'Current System (₹ Cr, 5 Yrs)': self.cost_current_5yr,
+            'ONOE System (₹ Cr, 5 Yrs)': self.cost_onoe_5yr,
+            'Est. Savings (₹ Cr, 5 Yrs)': self.savings,
+            'Projected Turnout (%)': self.turnout[:, i],
+        })
+
+    def to_frame(self):
+        """Long-format table with one row per (state, turnout change)."""
+        n_s, n_i = len(self.states), len(self.impacts)
+        s_idx, i_idx = np.meshgrid(np.arange(n_s), np.arange(n_i), indexing='ij')
+        s_idx, i_idx = s_idx.ravel(), i_idx.ravel()
+        return pd.DataFrame({
+            'State': np.asarray(self.states, dtype=object)[s_idx],
+            'Turnout Change (%)': self.impacts[i_idx],
+            'Current System (₹ Cr, 5 Yrs)': self.cost_current_5yr[s_idx],
+            'ONOE System (₹ Cr, 5 Yrs)': self.cost_onoe_5yr[s_idx],
+            'Est. Savings (₹ Cr, 5 Yrs)': self.savings[s_idx],
+            'Projected Turnout (%)': self.turnout[s_idx, i_idx],
+        })
+
+
+def build_scenario_grid(df):
+    """Evaluate the full state x turnout-impact grid for ``df``."""
+    states = tuple(df['State'].tolist())
+    base_cost = df['Est. Election Cost (₹ Cr)'].to_numpy(dtype=np.float64)
+    base_turnout = df['Turnout (%)'].to_numpy(dtype=np.float64)
+
+    impacts = np.arange(TURNOUT_MIN, TURNOUT_MAX + 1)
+
+    cost_current_5yr = base_cost * CURRENT_COST_FACTOR
+    cost_onoe_5yr = base_cost * ONOE_COST_FACTOR
+    savings = cost_current_5yr - cost_onoe_5yr
+    turnout = base_turnout[:, None] + impacts[None, :]
+
+    return ScenarioGrid(
+        states=states,
+        impacts=impacts,
+        base_cost=base_cost,
+        base_turnout=base_turnout,
+        cost_current_5yr=cost_current_5yr,
+        cost_onoe_5yr=cost_onoe_5yr,
+        savings=savings,
+        turnout=turnout,
+    )
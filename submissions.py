@@ -0,0 +1,237 @@
+"""Persistent quiz-submission pipeline.
+
+``SubmissionSink.submit`` only appends to an in-memory queue, so the
+``Submit Quiz`` path never waits on disk. A background writer drains the
+queue in batches into SQLite (WAL mode). In the same transaction it stores
+the raw rows and bumps the per-question and per-score counters. The
+aggregates view reads only those counter tables, never the raw submissions.
+
+The queue is bounded: if the writer falls that far behind, new submissions
+are dropped (and counted) rather than held in memory. A batch that fails to
+write is logged and retried on a fresh connection, then dropped; the writer
+itself keeps running.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+DB_PATH_ENV = 'ONOE_SUBMISSIONS_DB'
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'var', 'quiz_submissions.db')
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0  # seconds
+MAX_QUEUED = 50_000   # submissions waiting for the writer
+WRITE_ATTEMPTS = 3
+RETRY_DELAY = 0.5     # seconds, doubled after each failed attempt
+
+logger = logging.getLogger('onoe.submissions')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    submitted_at REAL NOT NULL,
+    quiz_version TEXT NOT NULL,
+    language TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    answers TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_stats (
+    quiz_version TEXT NOT NULL,
+    question INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (quiz_version, question)
+);
+CREATE TABLE IF NOT EXISTS score_counts (
+    quiz_version TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    submissions INTEGER NOT NULL,
+    PRIMARY KEY (quiz_version, score)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Submission:
+    quiz_version: str
+    language: str
+    correct: tuple      # one bool per question
+    answers: tuple      # the chosen option per question (None if skipped)
+    submitted_at: float
+
+    @property
+    def score(self):
+        return sum(self.correct)
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class SubmissionSink:
+    def __init__(self, path=None, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL, max_queued=MAX_QUEUED):
+        self.path = path or os.environ.get(DB_PATH_ENV, DEFAULT_DB_PATH)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        _connect(self.path).close()
+
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._stop = threading.Event()
+        self._flushed = threading.Condition()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self._writer = threading.Thread(target=self._run, name='quiz-submission-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def submit(self, quiz_version, language, correct, answers):
+        """Queue one submission; returns immediately, False if it was dropped."""
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(Submission(quiz_version, language, tuple(correct), tuple(answers), time.time()))
+        except queue.Full:
+            with self._pending_lock:
+                self._pending -= 1
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("Submission queue full; %d submission(s) dropped so far", dropped)
+            return False
+        return True
+
+    def _drain(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        conn = None
+        try:
+            while not (self._stop.is_set() and self._queue.empty()):
+                try:
+                    first = self._queue.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                batch = self._drain(first)
+                conn, ok = self._write_with_retries(conn, batch)
+                with self._pending_lock:
+                    self._pending -= len(batch)
+                    if ok:
+                        self.written += len(batch)
+                    else:
+                        self.dropped += len(batch)
+                with self._flushed:
+                    self._flushed.notify_all()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _write_with_retries(self, conn, batch):
+        """Write one batch, reconnecting between attempts; returns (connection, written)."""
+        delay = RETRY_DELAY
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                conn = conn or _connect(self.path)
+                self._write(conn, batch)
+                return conn, True
+            except Exception:
+                logger.exception("Writing %d quiz submission(s) failed (attempt %d/%d)",
+                                 len(batch), attempt, WRITE_ATTEMPTS)
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                if attempt < WRITE_ATTEMPTS and not self._stop.wait(delay):
+                    delay *= 2
+        logger.error("Dropped %d quiz submission(s) after %d attempts", len(batch), WRITE_ATTEMPTS)
+        return conn, False
+
+    def _write(self, conn, batch):
+        # Reduce the batch to counter deltas first: one UPSERT per key, not per row.
+        question_deltas = Counter()
+        score_deltas = Counter()
+        for sub in batch:
+            for q, ok in enumerate(sub.correct):
+                question_deltas[(sub.quiz_version, q, 'attempts')] += 1
+                question_deltas[(sub.quiz_version, q, 'correct')] += int(ok)
+            score_deltas[(sub.quiz_version, sub.score)] += 1
+
+        questions = {(v, q) for v, q, _ in question_deltas}
+        with conn:
+            conn.executemany(
+                'INSERT INTO submissions (submitted_at, quiz_version, language, score, total, answers) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(s.submitted_at, s.quiz_version, s.language, s.score, len(s.correct),
+                  json.dumps(s.answers, ensure_ascii=False)) for s in batch],
+            )
+            conn.executemany(
+                'INSERT INTO question_stats (quiz_version, question, attempts, correct) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (quiz_version, question) DO UPDATE SET '
+                'attempts = attempts + excluded.attempts, correct = correct + excluded.correct',
+                [(v, q, question_deltas[(v, q, 'attempts')], question_deltas[(v, q, 'correct')])
+                 for v, q in questions],
+            )
+            conn.executemany(
+                'INSERT INTO score_counts (quiz_version, score, submissions) VALUES (?, ?, ?) '
+                'ON CONFLICT (quiz_version, score) DO UPDATE SET submissions = submissions + excluded.submissions',
+                [(v, score, n) for (v, score), n in score_deltas.items()],
+            )
+
+    def flush(self, timeout=10.0):
+        """Block until everything submitted so far is on disk."""
+        deadline = time.monotonic() + timeout
+        with self._flushed:
+            while self._pending and time.monotonic() < deadline:
+                self._flushed.wait(timeout=0.1)
+        return self._pending == 0
+
+    def close(self):
+        if self._writer.is_alive():
+            self._stop.set()
+            self._writer.join(timeout=10.0)
+
+    def aggregates(self, quiz_version):
+        """Per-question correctness and the score distribution, from the counters."""
+        conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, timeout=30)
+        try:
+            questions = conn.execute(
+                'SELECT question, attempts, correct FROM question_stats WHERE quiz_version = ? ORDER BY question',
+                (quiz_version,),
+            ).fetchall()
+            scores = conn.execute(
+                'SELECT score, submissions FROM score_counts WHERE quiz_version = ? ORDER BY score',
+                (quiz_version,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {
+            'submissions': sum(n for _, n in scores),
+            'questions': [
+                {'question': q, 'attempts': a, 'correct': c, 'correct_rate': c / a if a else 0.0}
+                for q, a, c in questions
+            ],
+            'scores': dict(scores),
+        }
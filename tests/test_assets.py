@@ -0,0 +1,48 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from assets import LOGO, LOGO_SOURCE, STATIC_URL, fetch_logo, logo_url, static_url, stylesheet
+
+
+def _png(color):
+    buf = io.BytesIO()
+    Image.new('RGB', (4, 4), color).save(buf, format='PNG')
+    return buf.getvalue()
+
+
+def test_logo_falls_back_to_the_original_emblem_until_fetched(tmp_path):
+    assert logo_url(str(tmp_path)) == LOGO_SOURCE
+    (tmp_path / LOGO).write_bytes(_png('white'))
+    assert logo_url(str(tmp_path)).startswith(f'{STATIC_URL}/{LOGO}?v=')
+
+
+def test_static_url_changes_with_the_content(tmp_path):
+    (tmp_path / LOGO).write_bytes(_png('white'))
+    first = static_url(LOGO, str(tmp_path))
+    assert static_url(LOGO, str(tmp_path)) == first
+    (tmp_path / LOGO).write_bytes(_png('black'))
+    assert static_url(LOGO, str(tmp_path)) != first
+
+
+def test_fetch_logo_writes_the_png(tmp_path):
+    source = tmp_path / 'source.png'
+    source.write_bytes(_png('white'))
+    path = fetch_logo(source.as_uri(), str(tmp_path))
+    assert path == os.path.join(str(tmp_path), LOGO)
+    assert (tmp_path / LOGO).read_bytes() == source.read_bytes()
+
+
+def test_fetch_logo_rejects_non_images(tmp_path):
+    source = tmp_path / 'error.html'
+    source.write_text('<html>Too many requests</html>')
+    with pytest.raises(ValueError):
+        fetch_logo(source.as_uri(), str(tmp_path))
+    assert not (tmp_path / LOGO).exists()
+
+
+def test_stylesheet_is_a_style_block():
+    css = stylesheet()
+    assert css.startswith('<style>') and css.endswith('</style>')
@@ -0,0 +1,41 @@
+import io
+import os
+import zipfile
+
+import pandas as pd
+
+from batch import Progress, run_batch
+from data_store import open_dataset
+
+
+def _parameters(path):
+    with zipfile.ZipFile(path) as zf:
+        table = pd.read_parquet(io.BytesIO(zf.read('parameters.parquet')))
+    return dict(zip(table['Parameter'], table['Value']))
+
+
+def _files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root) for d, _, files in os.walk(root) for f in files)
+
+
+def test_one_report_per_state_and_turnout_change(tmp_path):
+    df = open_dataset().state_frame()
+    reports, written = run_batch(df, str(tmp_path), formats=('parquet', 'csv'), impacts=[0, 5],
+                                 workers=1, progress=Progress(2 * len(df), stream=io.StringIO()))
+    assert reports == len(df) * 2 * 2 and written > 0
+    files = _files(tmp_path)
+    assert 'national_grid.parquet' in files and 'national_grid.csv' in files
+    assert len([f for f in files if os.sep in f]) == reports
+    assert os.path.join('bihar', 't+5_parquet.zip') in files
+    assert os.path.join('bihar', 't+0_csv.zip') in files
+    assert _parameters(tmp_path / 'bihar' / 't+5_parquet.zip') == {
+        'State': 'Bihar', 'Projected Turnout Change (%)': '5', 'Scope': 'Selected state'}
+
+
+def test_all_states_reports_are_labelled_all_states(tmp_path):
+    df = open_dataset().state_frame()
+    reports, _ = run_batch(df, str(tmp_path), formats=('parquet',), impacts=[-3], all_states=True,
+                           workers=1, progress=Progress(1, stream=io.StringIO()))
+    assert reports == 1
+    params = _parameters(tmp_path / 'all_states' / 't-3_parquet.zip')
+    assert params['State'] == 'All states' and params['Scope'] == 'All states'
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from calendar_sync import (
+    COST_COLUMN, DISRUPTION_WEIGHT, EXTEND_PENALTY, PHASE_OVERHEAD, InfeasibleSchedule,
+    load_legislatures, month_index, solve,
+)
+
+
+def _partitions(items, max_blocks):
+    """Every partition of ``items`` into at most ``max_blocks`` non-empty blocks."""
+    if not items:
+        yield []
+        return
+    first, rest = items[0], items[1:]
+    for partition in _partitions(rest, max_blocks):
+        for i in range(len(partition)):
+            yield partition[:i] + [[first] + partition[i]] + partition[i + 1:]
+        if len(partition) < max_blocks:
+            yield [[first]] + partition
+
+
+def _exhaustive(table, max_phases, max_curtail, max_extend, fixed):
+    """Best objective over every grouping of legislatures (not only contiguous runs)."""
+    ends = [month_index(label) for label in table['Term Ends']]
+    is_fixed = table['Legislature'].isin(fixed).tolist()
+    dates = range(min(ends) - max_curtail, max(ends) + max_extend + 1)
+
+    def group_penalty(group):
+        best = np.inf
+        for date in dates:
+            total = 0.0
+            for m in group:
+                shift = date - ends[m]
+                if -shift > max_curtail or shift > max_extend or (is_fixed[m] and shift):
+                    break
+                total += DISRUPTION_WEIGHT * (max(-shift, 0) + EXTEND_PENALTY * max(shift, 0))
+            else:
+                best = min(best, total)
+        return best
+
+    base_cost = table[COST_COLUMN].sum()
+    return min(
+        sum(group_penalty(group) for group in partition) + len(partition) * PHASE_OVERHEAD + base_cost
+        for partition in _partitions(list(range(len(table))), max_phases)
+    )
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_matches_exhaustive_search(seed):
+    rng = np.random.default_rng(seed)
+    legislatures = load_legislatures()
+    table = legislatures.iloc[np.sort(rng.choice(len(legislatures), size=7, replace=False))]
+    max_phases = int(rng.integers(1, 4))
+    max_curtail, max_extend = int(rng.integers(6, 36)), int(rng.integers(0, 24))
+    fixed = ('Lok Sabha',) if seed % 2 else ()
+
+    expected = _exhaustive(table, max_phases, max_curtail, max_extend, fixed)
+    try:
+        schedule = solve(table, max_curtail=max_curtail, max_extend=max_extend,
+                         max_phases=max_phases, fixed=fixed)
+    except InfeasibleSchedule:
+        assert expected == np.inf
+        return
+    assert schedule.objective == pytest.approx(expected)
+    assert len(schedule.phases) <= max_phases
+    assert sorted(schedule.assignments['Legislature']) == sorted(table['Legislature'])
+
+
+def test_fixed_terms_do_not_move():
+    schedule = solve(load_legislatures())
+    lok_sabha = schedule.assignments.set_index('Legislature').loc['Lok Sabha']
+    assert lok_sabha['Term Change (months)'] == 0
+
+
+def test_earliest_after_every_term_is_infeasible():
+    with pytest.raises(InfeasibleSchedule):
+        solve(load_legislatures(), earliest='2040-01')
+
+
+def test_too_few_phases_is_infeasible():
+    with pytest.raises(InfeasibleSchedule):
+        solve(load_legislatures(), max_phases=1, max_curtail=0, max_extend=0)
@@ -0,0 +1,29 @@
+from caching import BytesLRUCache
+from charts import ChartRenderer
+
+CATEGORIES = ['Current System', 'ONOE System']
+
+
+def test_each_chart_is_rendered_once():
+    renderer = ChartRenderer()
+    first = renderer.cost_chart('Uttar Pradesh', 'English', CATEGORIES, [1800.0, 1320.0], 'Cost (₹ Cr)')
+    again = renderer.cost_chart('Uttar Pradesh', 'English', CATEGORIES, [1800.0, 1320.0], 'Cost (₹ Cr)')
+    assert first.startswith(b'\x89PNG') and again is first
+    assert renderer.renders == 1
+
+    renderer.cost_chart('Uttar Pradesh', 'English', CATEGORIES, [1800.0, 1100.0], 'Cost (₹ Cr)')
+    svg = renderer.cost_chart('Uttar Pradesh', 'English', CATEGORIES, [1800.0, 1100.0], 'Cost (₹ Cr)', fmt='svg')
+    assert b'<svg' in svg
+    assert renderer.renders == 3
+    assert renderer.stats()['hits'] == 1
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    cache = BytesLRUCache(max_bytes=10)
+    cache.put('a', b'aaaa')
+    cache.put('b', b'bbbb')
+    assert cache.get('a') == b'aaaa'
+    cache.put('c', b'cccc')              # over budget: 'b' is the least recently used
+    assert cache.get('b') is None and cache.get('a') and cache.get('c')
+    assert cache.put('huge', b'x' * 11) == b'x' * 11 and cache.get('huge') is None
+    assert cache.stats()['evictions'] == 1
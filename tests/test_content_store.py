@@ -0,0 +1,100 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from content_store import CONTENT_DIR, ContentStore, read_pack
+
+
+@pytest.fixture
+def content(tmp_path):
+    root = tmp_path / 'content'
+    shutil.copytree(CONTENT_DIR, root)
+    return root
+
+
+def _store(content, tmp_path):
+    return ContentStore(str(content), str(tmp_path / 'packs'))
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_missing_keys_fall_back_to_english(content, tmp_path):
+    ui = json.loads((content / 'hi' / 'ui.json').read_text(encoding='utf-8'))
+    del ui['nav_quiz']
+    _write_json(content / 'hi' / 'ui.json', ui)
+
+    store = _store(content, tmp_path)
+    english = store.ui('English')
+    hindi = store.ui('Hindi')
+    assert hindi.keys() == english.keys()
+    assert hindi['nav_quiz'] == english['nav_quiz']
+    assert hindi['nav_home'] != english['nav_home']
+    assert store.quiz('Hindi') == store.quiz('English')
+    assert store.coverage('Hindi')['ui'] == (len(ui.keys() & english.keys()), len(english))
+    assert store.coverage('Hindi')['quiz'] == (0, len(store.quiz('English')))
+
+
+def test_unknown_language_serves_english(content, tmp_path):
+    store = _store(content, tmp_path)
+    assert store.ui('Klingon') is store.ui('English')
+
+
+def test_precompiled_pack_is_reused(content, tmp_path, monkeypatch):
+    _store(content, tmp_path).ui('Hindi')
+    assert os.path.exists(tmp_path / 'packs' / 'hi.pack')
+
+    store = _store(content, tmp_path)
+    monkeypatch.setattr(store, 'compile', lambda lang: pytest.fail("recompiled an up-to-date pack"))
+    assert store.ui('Hindi')['nav_home']
+
+
+def test_pack_is_recompiled_when_a_source_changes(content, tmp_path):
+    assert _store(content, tmp_path).ui('Hindi')['nav_home'] != 'घर'
+    ui = json.loads((content / 'hi' / 'ui.json').read_text(encoding='utf-8'))
+    ui['nav_home'] = 'घर'
+    _write_json(content / 'hi' / 'ui.json', ui)
+    assert _store(content, tmp_path).ui('Hindi')['nav_home'] == 'घर'
+
+    # English edits reach the fallback text of every language.
+    en = json.loads((content / 'en' / 'ui.json').read_text(encoding='utf-8'))
+    en['brand_new_key'] = 'New'
+    _write_json(content / 'en' / 'ui.json', en)
+    assert _store(content, tmp_path).ui('Hindi')['brand_new_key'] == 'New'
+    assert read_pack(tmp_path / 'packs' / 'hi.pack')['ui']['brand_new_key'] == 'New'
+
+
+def test_unreadable_pack_is_recompiled(content, tmp_path):
+    os.makedirs(tmp_path / 'packs')
+    (tmp_path / 'packs' / 'hi.pack').write_bytes(b'not a pack')
+    assert _store(content, tmp_path).ui('Hindi')['nav_home']
+    assert read_pack(tmp_path / 'packs' / 'hi.pack')['code'] == 'hi'
+
+
+def test_packs_load_lazily_and_least_recent_is_evicted(content, tmp_path):
+    store = ContentStore(str(content), str(tmp_path / 'packs'), max_packs=1)
+    assert store.stats() == {'resident': [], 'loads': 0, 'evictions': 0}
+
+    english = store.ui('English')
+    assert store.ui('English') is english
+    assert store.stats() == {'resident': ['English'], 'loads': 1, 'evictions': 0}
+
+    store.facts('Hindi')
+    assert store.stats() == {'resident': ['Hindi'], 'loads': 2, 'evictions': 1}
+    assert store.ui('English') == english
+    assert store.stats()['evictions'] == 2
+
+
+def test_loaded_content_is_read_only_and_versioned(content, tmp_path):
+    store = _store(content, tmp_path)
+    with pytest.raises(TypeError):
+        store.ui('English')['nav_home'] = 'x'
+    assert isinstance(store.quiz('English'), tuple)
+    assert store.version('facts', 'Hindi') == store.version('facts', 'English')
+    assert store.version('ui', 'Hindi') != store.version('ui', 'English')
+    with pytest.raises(ValueError):
+        store.version('glossary', 'English')
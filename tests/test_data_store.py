@@ -0,0 +1,69 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_store import STATION_DTYPES, STATIONS_PATH_ENV, open_dataset, synthetic_stations
+
+
+@pytest.fixture
+def stations():
+    return synthetic_stations(5_000, n_states=6, constituencies_per_state=4, seed=1)
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_station_file_loads_without_warnings(stations, tmp_path, suffix):
+    path = str(tmp_path / f'stations{suffix}')
+    if suffix == '.parquet':
+        stations.to_parquet(path, index=False)
+    else:
+        stations.to_feather(path)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        ds = open_dataset(path)
+    assert ds.stats.rows == len(stations)
+    assert ds.stations['State'].dtype == 'category'
+    assert ds.stations['Constituency'].dtype == 'category'
+    for col, dtype in STATION_DTYPES.items():
+        assert ds.stations[col].dtype == dtype
+
+
+def test_rollups_match_groupby(stations, tmp_path):
+    path = str(tmp_path / 'stations.parquet')
+    # Shuffled rows are re-sorted by state on load.
+    stations.sample(frac=1, random_state=0).to_parquet(path, index=False)
+    ds = open_dataset(path)
+
+    expected = stations.groupby('State', observed=True).agg(
+        electors=('Electors', 'sum'), votes=('Votes Polled', 'sum'),
+        cost=('Est. Election Cost (₹ Cr)', 'sum'), stations=('Polling Station', 'size'))
+    assert list(ds.states.index) == list(expected.index)
+    np.testing.assert_allclose(ds.states['Voters (Cr)'], expected['electors'] / 1e7)
+    np.testing.assert_allclose(ds.states['Est. Election Cost (₹ Cr)'], expected['cost'], rtol=1e-5)
+    np.testing.assert_allclose(ds.states['Turnout (%)'],
+                               (100.0 * expected['votes'] / expected['electors']).round(1))
+    assert ds.states['Polling Stations'].tolist() == expected['stations'].tolist()
+    assert ds.constituencies['Polling Stations'].sum() == len(stations)
+
+
+def test_stations_for_returns_one_states_rows(stations, tmp_path):
+    path = str(tmp_path / 'stations.parquet')
+    stations.to_parquet(path, index=False)
+    ds = open_dataset(path)
+    for state in ds.states.index:
+        rows = ds.stations_for(state)
+        assert (rows['State'] == state).all()
+        assert len(rows) == ds.state(state)['Polling Stations']
+        assert ds.constituencies_for(state)['Polling Stations'].sum() == len(rows)
+
+
+def test_builtin_summary_without_a_station_file(monkeypatch):
+    monkeypatch.delenv(STATIONS_PATH_ENV, raising=False)
+    ds = open_dataset()
+    assert ds.stats.source == 'builtin'
+    assert isinstance(ds.state_frame(), pd.DataFrame)
+    assert 'Uttar Pradesh' in ds.state_frame()['State'].tolist()
+    with pytest.raises(LookupError):
+        ds.stations_for('Uttar Pradesh')
@@ -0,0 +1,51 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from data_store import open_dataset
+from export import ReportExporter, build_tables, encode_report
+from simulation import build_scenario_grid
+
+
+@pytest.fixture(scope='module')
+def tables():
+    df = open_dataset().state_frame()
+    return build_tables(df, build_scenario_grid(df), 'Bihar', 5)
+
+
+def _decode(data, fmt):
+    if fmt == 'xlsx':
+        return pd.read_excel(io.BytesIO(data), sheet_name=None, engine='openpyxl')
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        read = pd.read_csv if fmt == 'csv' else pd.read_parquet
+        return {name: read(io.BytesIO(zf.read(name))) for name in zf.namelist()}
+
+
+@pytest.mark.parametrize('fmt', ['xlsx', 'csv', 'parquet'])
+def test_reports_decode_back_to_the_tables(tables, fmt):
+    decoded = list(_decode(encode_report(tables, fmt), fmt).values())
+    assert len(decoded) == len(tables)
+    for (name, table), back in zip(tables.items(), decoded):
+        table = table.reset_index(drop=True)
+        if fmt != 'parquet':
+            # Text formats do not keep dtypes: compare values.
+            table = table.astype({c: str for c in table.select_dtypes(exclude='number').columns})
+            back = back.astype({c: str for c in back.select_dtypes(exclude='number').columns})
+        pd.testing.assert_frame_equal(back, table, check_dtype=fmt == 'parquet', obj=name)
+
+
+def test_sheet_and_member_names(tables):
+    assert list(_decode(encode_report(tables, 'xlsx'), 'xlsx')) == list(tables)
+    assert list(_decode(encode_report(tables, 'csv'), 'csv')) == [
+        'simulation.csv', 'parameters.csv', 'scenario_grid.csv', 'input_data.csv']
+
+
+def test_identical_requests_are_served_from_the_cache(tables):
+    exporter = ReportExporter()
+    first = exporter.export(tables, 'parquet')
+    assert exporter.export({name: table.copy() for name, table in tables.items()}, 'parquet') is first
+    assert exporter.cache.stats()['hits'] == 1
+    with pytest.raises(ValueError):
+        encode_report(tables, 'pdf')
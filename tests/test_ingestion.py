@@ -0,0 +1,113 @@
+import io
+import os
+import struct
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ingestion import (
+    MAX_DISTANCE, ReportIngestor, UnreadableImage, UploadTooLarge, _to_signed, segments, stream_to_disk,
+)
+
+
+def _png(array, size=None, fmt='PNG'):
+    img = Image.fromarray(array)
+    if size is not None:
+        img = img.resize(size, Image.Resampling.BILINEAR)
+    out = io.BytesIO()
+    img.save(out, format=fmt)
+    out.seek(0)
+    return out
+
+
+def _screenshot(seed):
+    rng = np.random.default_rng(seed)
+    return (rng.random((48, 64, 3)) * 255).astype(np.uint8).repeat(10, axis=0).repeat(10, axis=1)
+
+
+def _stored_files(root):
+    return [os.path.join(d, f) for d, _, files in os.walk(os.path.join(root, 'files')) for f in files]
+
+
+@pytest.fixture
+def ingestor(tmp_path):
+    ing = ReportIngestor(str(tmp_path / 'reports'))
+    yield ing
+    ing._conn.close()
+
+
+def test_identical_and_near_duplicate_uploads_share_a_cluster(ingestor):
+    first = ingestor.ingest(_png(_screenshot(1)), suffix='.png')
+    assert first['new'] and first['reports'] == 1
+
+    again = ingestor.ingest(_png(_screenshot(1)), suffix='.png')
+    assert again == {'image_id': first['image_id'], 'reports': 2, 'new': False, 'distance': 0}
+
+    # Rescaled and re-encoded as JPEG: different bytes, same picture.
+    resized = ingestor.ingest(_png(_screenshot(1), size=(320, 240), fmt='JPEG'), suffix='.jpg')
+    assert resized['image_id'] == first['image_id'] and not resized['new']
+    assert resized['distance'] <= MAX_DISTANCE
+
+    other = ingestor.ingest(_png(_screenshot(2)), suffix='.png')
+    assert other['new'] and other['image_id'] != first['image_id']
+
+    top = ingestor.top_images()
+    assert [row['reports'] for row in top] == [3, 1]
+    assert len(_stored_files(ingestor.root)) == 3   # the byte-identical copy is stored once
+
+
+def test_multi_index_lookup_matches_linear_scan(ingestor):
+    rng = np.random.default_rng(0)
+    stored = [int(h) for h in rng.integers(0, 2**64, size=2000, dtype=np.uint64)]
+    with ingestor._conn:
+        ingestor._conn.executemany(
+            'INSERT INTO images (phash, seg0, seg1, seg2, seg3, reports, first_seen, last_seen, sample_path) '
+            "VALUES (?, ?, ?, ?, ?, 1, 0, 0, '')",
+            [[_to_signed(h), *segments(h)] for h in stored],
+        )
+    for trial in range(300):
+        base = stored[trial % len(stored)] if trial % 2 else int(rng.integers(0, 2**64, dtype=np.uint64))
+        flips = rng.choice(64, size=int(rng.integers(0, 6)), replace=False)
+        query = base ^ sum(1 << int(b) for b in flips)
+
+        distances = [bin(query ^ h).count('1') for h in stored]
+        nearest = min(distances)
+        match = ingestor.find_similar(query)
+        if nearest <= MAX_DISTANCE:
+            assert match is not None and match[1] == nearest
+            assert distances[match[0] - 1] == nearest
+        else:
+            assert match is None
+
+
+def test_unreadable_upload_is_rejected_and_removed(ingestor):
+    with pytest.raises(UnreadableImage):
+        ingestor.ingest(io.BytesIO(b'not an image' * 100), suffix='.png')
+    assert _stored_files(ingestor.root) == []
+
+
+def _png_header(width, height):
+    """A tiny PNG that declares ``width`` x ``height`` pixels (a decompression bomb's header)."""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    return io.BytesIO(b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+                      + chunk(b'IDAT', zlib.compress(b'\0' * 64)) + chunk(b'IEND', b''))
+
+
+@pytest.mark.parametrize('width, height', [(20000, 20000), (8000, 8000)])
+def test_oversized_image_is_rejected_before_decoding(ingestor, width, height):
+    # 20000 x 20000 trips Pillow's own bomb check; 8000 x 8000 only the app's cap.
+    with pytest.raises(UnreadableImage):
+        ingestor.ingest(_png_header(width, height), suffix='.png')
+    assert _stored_files(ingestor.root) == []
+
+
+def test_stream_to_disk_enforces_the_size_cap(tmp_path):
+    with pytest.raises(UploadTooLarge):
+        stream_to_disk(io.BytesIO(b'x' * 5000), str(tmp_path), max_bytes=4096, chunk_bytes=1024)
+    assert os.listdir(tmp_path) == []
+    path, sha, size = stream_to_disk(io.BytesIO(b'x' * 4096), str(tmp_path), max_bytes=4096, chunk_bytes=1024)
+    assert size == 4096 and os.path.basename(path) == sha
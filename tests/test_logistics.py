@@ -0,0 +1,89 @@
+import math
+
+import pytest
+
+from data_store import STATIONS_PATH_ENV, open_dataset, synthetic_stations
+from logistics import (
+    BALLOT_UNIT_CANDIDATES, CAPF_PER_SENSITIVE_STATION, EXTRA_OFFICER_PER_POLL,
+    LARGE_STATION_ELECTORS, PARTY_SIZE, POLICE_PER_STATION, LogisticsModel, LogisticsParams,
+)
+
+
+@pytest.fixture(scope='module')
+def dataset(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('stations') / 'stations.arrow')
+    synthetic_stations(20_000, n_states=5, constituencies_per_state=6, seed=2).to_feather(path)
+    return open_dataset(path)
+
+
+def _loop_requirements(dataset, params, phases):
+    """Station-by-station reference: {(state, phase): {column: value}}."""
+    rows = {}
+    for state in dataset.states.index:
+        n_phases = phases.get(state, 1)
+        for p in range(1, n_phases + 1):
+            rows[state, p] = {'Polling Stations': 0, 'Electors': 0, 'large': 0}
+        stations = dataset.stations_for(state)
+        for code, electors in zip(stations['Constituency'].cat.codes, stations['Electors']):
+            row = rows[state, int(code) % n_phases + 1]
+            row['Polling Stations'] += 1
+            row['Electors'] += int(electors)
+            row['large'] += int(electors > LARGE_STATION_ELECTORS)
+
+    bu_per_station = math.ceil(params.candidates / BALLOT_UNIT_CANDIDATES)
+    for row in rows.values():
+        stations = row['Polling Stations']
+        sets = stations * params.polls
+        party = PARTY_SIZE + (params.polls - 1) * EXTRA_OFFICER_PER_POLL
+        row['Ballot Units'] = math.ceil(sets * bu_per_station * (1 + params.bu_reserve))
+        row['Control Units'] = math.ceil(sets * (1 + params.cu_reserve))
+        row['VVPATs'] = math.ceil(sets * (1 + params.vvpat_reserve))
+        row['Polling Staff'] = math.ceil((stations * party + row.pop('large')) * (1 + params.staff_reserve))
+        row['Security Personnel'] = math.ceil(
+            stations * (POLICE_PER_STATION + params.sensitive_share * CAPF_PER_SENSITIVE_STATION))
+    return rows
+
+
+@pytest.mark.parametrize('params, n_phases', [
+    (LogisticsParams(), {}),
+    (LogisticsParams(polls=1, candidates=20, sensitive_share=0.3), {'State 00': 3, 'State 02': 7}),
+])
+def test_requirements_match_a_station_loop(dataset, params, n_phases):
+    model = LogisticsModel(dataset)
+    req = model.requirements(params, n_phases)
+    expected = _loop_requirements(dataset, params, n_phases)
+
+    got = {(row.pop('State'), row.pop('Phase')): row for row in req.by_phase.to_dict('records')}
+    assert got == expected
+
+    for row in req.by_state.to_dict('records'):
+        phases = [v for (state, _), v in expected.items() if state == row['State']]
+        assert row['Phases'] == len(phases)
+        assert row['VVPATs'] == sum(p['VVPATs'] for p in phases)
+        assert row['Polling Staff'] == max(p['Polling Staff'] for p in phases)
+
+    assert req.national['Ballot Units'] == sum(p['Ballot Units'] for p in expected.values())
+    busiest = max(n_phases.values(), default=1)
+    assert req.national['Phases'] == busiest
+    assert req.national['Security Personnel'] == max(
+        sum(v['Security Personnel'] for (_, p), v in expected.items() if p == phase)
+        for phase in range(1, busiest + 1))
+
+
+def test_rephasing_one_state_reduces_only_that_state(dataset):
+    model = LogisticsModel(dataset)
+    model.requirements()
+    assert model.reductions == len(model.states)
+    model.requirements(LogisticsParams(candidates=40))
+    assert model.reductions == len(model.states)
+    model.requirements(phases={'State 01': 4})
+    assert model.reductions == len(model.states) + 1
+
+
+def test_builtin_summary_splits_stations_evenly(monkeypatch):
+    monkeypatch.delenv(STATIONS_PATH_ENV, raising=False)
+    model = LogisticsModel(open_dataset())
+    by_phase = model.requirements(phases={'Bihar': 3}).by_phase
+    bihar = by_phase[by_phase['State'] == 'Bihar']['Polling Stations'].tolist()
+    assert sum(bihar) == 77462
+    assert max(bihar) - min(bihar) <= 1
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+import profiling
+from profiling import (
+    BACKGROUND, DEBUG_ENV, DEBUG_TOKEN_ENV, TOTAL, MetricsStore, begin_run, debug_enabled,
+    deep_size, end_run, percentiles, profiled, timed,
+)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    store = MetricsStore()
+    monkeypatch.setattr(profiling, 'metrics', store)
+    monkeypatch.delenv(profiling.METRICS_TEXTFILE_ENV, raising=False)
+    yield store
+    profiling._local.run = None
+
+
+def _sections(store):
+    return {(row['page'], row['section']): row['count'] for row in store.summary()}
+
+
+def test_percentiles_match_numpy():
+    values = [5.0, 1.0, 9.5, 3.25, 7.0, 2.0, 8.0]
+    assert percentiles(values, (0, 50, 95, 99, 100)) == pytest.approx(
+        np.percentile(values, [0, 50, 95, 99, 100]).tolist())
+    assert percentiles([4.0]) == [4.0, 4.0, 4.0]
+
+
+@pytest.mark.parametrize('env, query, expected', [
+    ({}, {'debug': '1'}, False),
+    ({DEBUG_ENV: '1'}, None, True),
+    ({DEBUG_TOKEN_ENV: 's3cret'}, {'debug': 's3cret'}, True),
+    ({DEBUG_TOKEN_ENV: 's3cret'}, {'debug': 'guess'}, False),
+    ({DEBUG_TOKEN_ENV: 's3cret'}, {}, False),
+    ({DEBUG_TOKEN_ENV: ''}, {'debug': ''}, False),
+])
+def test_debug_panel_needs_the_env_switch_or_token(monkeypatch, env, query, expected):
+    monkeypatch.delenv(DEBUG_ENV, raising=False)
+    monkeypatch.delenv(DEBUG_TOKEN_ENV, raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    assert debug_enabled(query) is expected
+
+
+def test_run_records_sections_and_session_state(metrics):
+    begin_run()
+    with timed('chart'):
+        pass
+    run = end_run('simulator', {'picked': 'Bihar', 'values': [1, 2, 3]})
+    assert [name for name, _ in run.sections] == ['chart']
+    assert run.session_state_bytes > 0
+    assert _sections(metrics) == {('simulator', 'chart'): 1, ('simulator', TOTAL): 1}
+    assert metrics.session_state_summary()[0]['page'] == 'simulator'
+    assert end_run('simulator') is None
+
+
+def test_timed_outside_a_run_is_background(metrics):
+    with timed('download'):
+        pass
+    assert _sections(metrics) == {(BACKGROUND, 'download'): 1}
+
+
+def test_fragment_is_a_section_or_a_run_of_its_own(metrics):
+    @profiled('quiz')
+    def _quiz_form():
+        pass
+
+    begin_run()
+    _quiz_form()
+    end_run('quiz')
+    _quiz_form()
+    assert _sections(metrics) == {
+        ('quiz', 'quiz_form'): 1, ('quiz', TOTAL): 1, ('quiz:quiz_form', TOTAL): 1,
+    }
+
+
+def test_failed_fragment_rerun_is_still_recorded(metrics):
+    @profiled('search')
+    def _results():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        _results()
+    assert _sections(metrics) == {('search:results', TOTAL): 1}
+    assert profiling.current_run() is None
+
+
+def test_prometheus_textfile(metrics, tmp_path):
+    metrics.record_run(profiling.Run(page='home', sections=[('logo', 0.001)], total=0.004))
+    path = tmp_path / 'onoe.prom'
+    metrics.maybe_write_textfile(str(path), interval=0)
+    text = path.read_text()
+    assert 'onoe_rerun_seconds{page="home",section="total",quantile="0.95"} 0.004000' in text
+    assert 'onoe_rerun_seconds_count{page="home",section="logo"} 1' in text
+
+
+def test_deep_size_follows_containers_once():
+    payload = 'x' * 10_000
+    assert deep_size({'a': payload}) > 10_000
+    assert deep_size([payload, payload]) < 2 * 10_000
+    assert deep_size(np.zeros(1000)) >= 8000
@@ -0,0 +1,81 @@
+import math
+
+import pytest
+
+from content_store import ContentStore
+from search import BM25_B, BM25_K1, FIELD_WEIGHTS, FactIndex, tokenize
+
+FACTS = {
+    'cost': {'myth': 'Simultaneous elections cost more',
+             'fact': 'One poll saves the cost of repeated deployments', 'source': 'Law Commission'},
+    'evm': {'myth': 'There are not enough EVMs',
+            'fact': 'The commission estimates the EVM and VVPAT units needed', 'source': 'ECI'},
+    'federal': {'myth': 'Federalism ends with one election',
+                'fact': 'States keep their powers; only the election calendar changes', 'source': 'NITI Aayog'},
+    'turnout': {'myth': 'Voter turnout will fall',
+                'fact': 'Turnout depends on many factors besides the calendar', 'source': 'ECI'},
+}
+
+
+def _reference_scores(facts, query):
+    """Plain BM25 over exact tokens, with the index's field weights."""
+    docs = []
+    for key, entry in facts.items():
+        tf = {}
+        for field, text in (('key', key), ('myth', entry['myth']), ('fact', entry['fact']),
+                            ('source', entry['source'])):
+            for token in tokenize(text):
+                tf[token] = tf.get(token, 0.0) + FIELD_WEIGHTS[field]
+        docs.append(tf)
+    lengths = [sum(tf.values()) for tf in docs]
+    avg_len = sum(lengths) / len(docs)
+    scores = [0.0] * len(docs)
+    for token in dict.fromkeys(tokenize(query)):
+        df = sum(token in tf for tf in docs)
+        idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+        for d, tf in enumerate(docs):
+            if token in tf:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[d] / avg_len)
+                scores[d] += idf * tf[token] * (BM25_K1 + 1) / (tf[token] + norm)
+    return dict(zip(facts, scores))
+
+
+def test_ranks_like_reference_bm25():
+    index = FactIndex(FACTS)
+    # Whole words that are not a prefix of another term: no expansion applies.
+    for query in ('ECI', 'calendar', 'turnout voter', 'cost deployments'):
+        expected = _reference_scores(FACTS, query)
+        ranked = sorted((key for key in FACTS if expected[key] > 0), key=lambda key: -expected[key])
+        assert index.search(query) == ranked, query
+
+
+def test_empty_query_returns_all_in_order():
+    index = FactIndex(FACTS)
+    assert index.search('') == list(FACTS)
+    assert index.search('   ', limit=2) == list(FACTS)[:2]
+
+
+def test_prefix_and_typo_matching():
+    index = FactIndex(FACTS)
+    assert index.search('feder')[0] == 'federal'
+    assert index.search('elecshun') == []           # two edits away: no match
+    assert index.search('turnuot')[0] == 'turnout'  # one transposition
+    assert index.search('zzzz') == []
+
+
+def test_normalizes_case_and_width():
+    index = FactIndex(FACTS)
+    assert index.search('ＥＶＭ') == index.search('evm') == ['evm']
+
+
+def test_limit_keeps_the_best_hits():
+    index = FactIndex(FACTS)
+    assert index.search('the', limit=2) == index.search('the')[:2]
+
+
+@pytest.mark.parametrize('lang', ['English', 'Hindi'])
+def test_every_fact_finds_itself_by_key(lang, tmp_path):
+    facts = ContentStore(packs_dir=str(tmp_path)).facts(lang)
+    index = FactIndex(facts)
+    for key in facts:
+        assert key in index.search(key), key
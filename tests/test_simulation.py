@@ -0,0 +1,46 @@
+import pytest
+
+from data_store import open_dataset
+from simulation import TURNOUT_MAX, TURNOUT_MIN, build_scenario_grid
+
+
+@pytest.fixture(scope='module')
+def df():
+    return open_dataset().state_frame()
+
+
+def _per_slider(df, state, impact):
+    """The simulator's original calculation for one slider position."""
+    row = df[df['State'] == state].iloc[0]
+    base_cost = row['Est. Election Cost (₹ Cr)']
+    cost_current_5yr = base_cost * 1.5
+    cost_onoe_5yr = base_cost * 1.1
+    return {
+        'cost_current_5yr': cost_current_5yr,
+        'cost_onoe_5yr': cost_onoe_5yr,
+        'savings': cost_current_5yr - cost_onoe_5yr,
+        'turnout': row['Turnout (%)'] + impact,
+    }
+
+
+def test_lookup_matches_per_slider_calculation(df):
+    grid = build_scenario_grid(df)
+    for state in df['State']:
+        for impact in range(TURNOUT_MIN, TURNOUT_MAX + 1):
+            result = grid.lookup(state, impact)
+            for key, expected in _per_slider(df, state, impact).items():
+                assert result[key] == pytest.approx(expected), (state, impact, key)
+            assert result['savings'] > 0
+
+
+def test_tables_agree_with_lookup(df):
+    grid = build_scenario_grid(df)
+    frame = grid.to_frame()
+    assert len(frame) == len(df) * (TURNOUT_MAX - TURNOUT_MIN + 1)
+    comparison = grid.compare_states(7).set_index('State')
+    for state in df['State']:
+        result = grid.lookup(state, 7)
+        assert comparison.at[state, 'Est. Savings (₹ Cr, 5 Yrs)'] == pytest.approx(result['savings'])
+        assert comparison.at[state, 'Projected Turnout (%)'] == pytest.approx(result['turnout'])
+        row = frame[(frame['State'] == state) & (frame['Turnout Change (%)'] == 7)]
+        assert len(row) == 1 and row['ONOE System (₹ Cr, 5 Yrs)'].iloc[0] == pytest.approx(result['cost_onoe_5yr'])
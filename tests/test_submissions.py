@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+import submissions
+from submissions import SubmissionSink
+
+
+@pytest.fixture
+def sink(tmp_path, monkeypatch):
+    monkeypatch.setattr(submissions, 'RETRY_DELAY', 0.01)
+    sink = SubmissionSink(str(tmp_path / 'submissions.db'), flush_interval=0.05)
+    yield sink
+    sink.close()
+
+
+def test_counters_aggregate_every_submission(sink):
+    answers = [(True, True, False), (True, False, False), (False, False, False), (True, True, True)]
+    for correct in answers:
+        assert sink.submit('v1', 'English', correct, ['a'] * len(correct))
+    sink.submit('v2', 'Hindi', (True,), ['a'])
+    assert sink.flush()
+
+    stats = sink.aggregates('v1')
+    assert stats['submissions'] == 4
+    assert [q['attempts'] for q in stats['questions']] == [4, 4, 4]
+    assert [q['correct'] for q in stats['questions']] == [3, 2, 1]
+    assert stats['questions'][0]['correct_rate'] == 0.75
+    assert stats['scores'] == {0: 1, 1: 1, 2: 1, 3: 1}
+    assert sink.aggregates('v2')['submissions'] == 1
+    assert sink.written == 5
+
+
+def test_raw_rows_are_kept(sink):
+    sink.submit('v1', 'English', (True, False), ['yes', None])
+    assert sink.flush()
+    with sqlite3.connect(sink.path) as conn:
+        rows = conn.execute('SELECT quiz_version, language, score, total, answers FROM submissions').fetchall()
+    assert rows == [('v1', 'English', 1, 2, '["yes", null]')]
+
+
+def test_writer_survives_a_failed_batch(sink):
+    sink.submit('v1', 'English', (True,), ['a'])
+    assert sink.flush()
+    with sqlite3.connect(sink.path) as conn:
+        conn.execute('DROP TABLE score_counts')
+
+    sink.submit('v1', 'English', (True,), ['a'])
+    assert sink.flush()
+    # The retry reconnects, which recreates the table.
+    assert sink._writer.is_alive()
+    assert sink.written == 2 and sink.dropped == 0
+    assert sink.aggregates('v1')['questions'][0]['attempts'] == 2
+
+
+def test_batch_is_dropped_after_repeated_failures(sink, monkeypatch):
+    def fail(conn, batch):
+        raise sqlite3.OperationalError('disk I/O error')
+
+    monkeypatch.setattr(sink, '_write', fail)
+    sink.submit('v1', 'English', (True,), ['a'])
+    assert sink.flush()
+    assert sink._writer.is_alive()
+    assert sink.dropped == 1 and sink.written == 0
+
+
+def test_full_queue_drops_new_submissions(tmp_path):
+    sink = SubmissionSink(str(tmp_path / 'submissions.db'), max_queued=2)
+    sink.close()   # no writer: the queue only fills
+    assert [sink.submit('v1', 'English', (True,), ['a']) for _ in range(4)] == [True, True, False, False]
+    assert sink.dropped == 2
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import uncertainty
+from uncertainty import NATIONAL_MAX_SAMPLES, PERCENTILES, run_monte_carlo
+
+STATES = ('A', 'B', 'C')
+BASE_COST = [4500.0, 3200.0, 1500.0]
+BASE_TURNOUT = [57.0, 61.5, 58.8]
+VOTERS = [15.4, 9.3, 1.5]
+
+
+def _run(n_samples=50_000, **kwargs):
+    kwargs.setdefault('workers', 1)
+    return run_monte_carlo(STATES, BASE_COST, BASE_TURNOUT, VOTERS, impact=5,
+                           n_samples=n_samples, chunk_size=20_000, **kwargs)
+
+
+def _assert_same(a, b):
+    for field in ('cost_factor', 'turnout_shift', 'national_savings', 'national_turnout'):
+        da, db = getattr(a, field), getattr(b, field)
+        if da is None:
+            assert db is None
+            continue
+        np.testing.assert_array_equal(da.counts, db.counts)
+        np.testing.assert_array_equal(da.edges, db.edges)
+        assert da.mean == pytest.approx(db.mean, rel=1e-12)
+
+
+def test_percentiles_are_ordered_and_inside_the_bounds():
+    mc = _run(national=True)
+    for dist in (mc.savings('A'), mc.turnout('B'), mc.national_savings, mc.national_turnout):
+        bands = dist.percentiles()
+        values = [bands[q] for q in PERCENTILES]
+        assert values == sorted(values)
+        assert dist.edges[0] <= values[0] and values[-1] <= dist.edges[-1]
+        assert int(dist.counts.sum()) > 0
+
+    # The point estimate (1.5 - 1.1 of base cost) sits inside the central band.
+    bands = mc.savings('A').percentiles()
+    assert bands[25] < 0.4 * BASE_COST[0] < bands[75]
+    assert mc.turnout('A').percentiles()[50] == pytest.approx(BASE_TURNOUT[0] + 5, abs=0.1)
+
+
+def test_same_seed_gives_the_same_result():
+    _assert_same(_run(seed=7, national=True), _run(seed=7, national=True))
+    assert not np.array_equal(_run(seed=7).cost_factor.counts, _run(seed=8).cost_factor.counts)
+
+
+def test_pool_matches_inline():
+    _assert_same(_run(seed=3, national=True, workers=1), _run(seed=3, national=True, workers=2))
+
+
+def test_pool_is_shared_across_worker_counts():
+    _run(workers=2)
+    pool = uncertainty._get_executor()
+    _run(workers=3)
+    assert uncertainty._get_executor() is pool
+
+
+def test_national_run_is_capped():
+    mc = _run(n_samples=NATIONAL_MAX_SAMPLES + 20_000, national=True)
+    assert mc.n_samples == NATIONAL_MAX_SAMPLES + 20_000
+    assert mc.national_samples == NATIONAL_MAX_SAMPLES
+    assert int(mc.national_savings.counts.sum()) == NATIONAL_MAX_SAMPLES
+    assert int(mc.cost_factor.counts.sum()) == mc.n_samples
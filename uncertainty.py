@@ -0,0 +1,236 @@
+"""Monte Carlo uncertainty mode for the Impact Simulator.
+
+Instead of the fixed cost multipliers and the flat turnout offset used by the
+scenario grid, this draws cost multipliers and turnout shifts and reports
+percentile bands and histograms.
+
+Every state draws its multipliers from the same distributions, and a state's
+savings and turnout are a linear function of those draws (``base_cost * X``
+and ``base_turnout + impact + Z``). So the per-state bands come from a single
+standardized sample that is scaled per state, which keeps the cost flat as
+the number of states grows. Only the national total needs independent draws
+per state, so it costs ``n_states`` times as much per sample; it is capped at
+NATIONAL_MAX_SAMPLES draws, enough for its percentile bands to within a few
+tenths of a percent. That run is chunked and can be spread over a process
+pool.
+
+Samples are reduced to fixed-bin histograms chunk by chunk, so memory stays
+flat however many samples are requested. Each chunk gets its own child seed,
+which makes results identical for a given seed whether the chunks run inline
+or on the pool.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+# Triangular (low, mode, high) cost multipliers over the 5-year window.
+# The modes are the point estimates used by the deterministic simulator.
+CURRENT_MULTIPLIER = (1.3, 1.5, 1.8)
+ONOE_MULTIPLIER = (1.0, 1.1, 1.3)
+TURNOUT_SHIFT_SD = 3.0  # percentage points around the slider value
+TURNOUT_CLIP_SD = 5.0
+
+SAMPLE_SIZES = (100_000, 250_000, 500_000, 1_000_000)
+CHUNK_SIZE = 100_000
+N_BINS = 1000          # resolution used for percentiles
+PERCENTILES = (5, 25, 50, 75, 95)
+NATIONAL_MAX_SAMPLES = 100_000
+
+# Use the process pool only when there is enough work to pay for the IPC.
+PROCESS_POOL_MIN_DRAWS = 4_000_000
+
+
+@dataclass(frozen=True)
+class Distribution:
+    edges: np.ndarray    # (B + 1,)
+    counts: np.ndarray   # (B,)
+    mean: float
+
+    def scaled(self, scale=1.0, shift=0.0):
+        return Distribution(self.edges * scale + shift, self.counts, self.mean * scale + shift)
+
+    def percentiles(self, qs=PERCENTILES):
+        # Linear interpolation inside the bin holding each requested rank.
+        cum = np.cumsum(self.counts)
+        out = {}
+        for q in qs:
+            rank = cum[-1] * q / 100.0
+            b = int(np.searchsorted(cum, rank))
+            before = cum[b - 1] if b > 0 else 0
+            frac = min(max((rank - before) / max(self.counts[b], 1), 0.0), 1.0)
+            out[q] = float(self.edges[b] + frac * (self.edges[b + 1] - self.edges[b]))
+        return out
+
+    def histogram(self, bins=50):
+        """Return (bin_centers, counts) rebinned to ``bins`` bars."""
+        group = max(len(self.counts) // bins, 1)
+        n = len(self.counts) // group * group
+        counts = self.counts[:n].reshape(-1, group).sum(axis=1)
+        edges = self.edges[:n + 1:group]
+        return (edges[:-1] + edges[1:]) / 2, counts
+
+
+@dataclass(frozen=True)
+class UncertaintyResult:
+    states: tuple
+    n_samples: int
+    base_cost: np.ndarray
+    base_turnout: np.ndarray
+    impact: int
+    cost_factor: Distribution      # X = current multiplier - ONOE multiplier
+    turnout_shift: Distribution    # Z, in percentage points
+    national_savings: Distribution = None
+    national_turnout: Distribution = None
+    national_samples: int = 0
+
+    def savings(self, state):
+        s = self.states.index(state)
+        return self.cost_factor.scaled(self.base_cost[s])
+
+    def turnout(self, state):
+        s = self.states.index(state)
+        return self.turnout_shift.scaled(1.0, self.base_turnout[s] + self.impact)
+
+
+def _triangular_range():
+    lo = CURRENT_MULTIPLIER[0] - ONOE_MULTIPLIER[2]
+    hi = CURRENT_MULTIPLIER[2] - ONOE_MULTIPLIER[0]
+    return lo, hi
+
+
+def _histogram(values, lo, hi, n_bins):
+    idx = ((values - lo) * (n_bins / (hi - lo))).astype(np.int64)
+    np.clip(idx, 0, n_bins - 1, out=idx)
+    return np.bincount(idx.ravel(), minlength=n_bins)
+
+
+def _standard_chunk(task):
+    seed_seq, n, n_bins = task
+    rng = np.random.default_rng(seed_seq)
+    x = rng.triangular(*CURRENT_MULTIPLIER, size=n) - rng.triangular(*ONOE_MULTIPLIER, size=n)
+    z = rng.normal(0.0, TURNOUT_SHIFT_SD, size=n)
+    z_lim = TURNOUT_CLIP_SD * TURNOUT_SHIFT_SD
+    np.clip(z, -z_lim, z_lim, out=z)
+    x_lo, x_hi = _triangular_range()
+    return (
+        _histogram(x, x_lo, x_hi, n_bins), x.sum(),
+        _histogram(z, -z_lim, z_lim, n_bins), z.sum(),
+    )
+
+
+def _national_chunk(task):
+    seed_seq, n, base_cost, voter_share, n_bins = task
+    rng = np.random.default_rng(seed_seq)
+    n_states = base_cost.shape[0]
+    x = rng.triangular(*CURRENT_MULTIPLIER, size=(n, n_states))
+    x -= rng.triangular(*ONOE_MULTIPLIER, size=(n, n_states))
+    total = x @ base_cost
+    z = rng.normal(0.0, TURNOUT_SHIFT_SD, size=(n, n_states))
+    z_lim = TURNOUT_CLIP_SD * TURNOUT_SHIFT_SD
+    np.clip(z, -z_lim, z_lim, out=z)
+    shift = z @ voter_share
+    x_lo, x_hi = _triangular_range()
+    cost_sum = base_cost.sum()
+    return (
+        _histogram(total, x_lo * cost_sum, x_hi * cost_sum, n_bins), total.sum(),
+        _histogram(shift, -z_lim, z_lim, n_bins), shift.sum(),
+    )
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """The shared process pool: one worker per CPU, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # forkserver: the Streamlit server runs threads, which fork would copy mid-state.
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                            mp_context=multiprocessing.get_context('forkserver'))
+        return _executor
+
+
+@atexit.register
+def _shutdown_executor():
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_chunks(fn, make_task, n_samples, seed, stream, chunk_size, workers, draws_per_sample):
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    tasks = [make_task(ss, n) for ss, n in zip(np.random.SeedSequence([seed, stream]).spawn(len(sizes)), sizes)]
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(tasks))
+        if n_samples * draws_per_sample < PROCESS_POOL_MIN_DRAWS:
+            workers = 1
+    parts = _get_executor().map(fn, tasks) if workers > 1 else map(fn, tasks)
+
+    a_counts = b_counts = 0
+    a_sum = b_sum = 0.0
+    for a_c, a_s, b_c, b_s in parts:
+        a_counts = a_counts + a_c
+        a_sum += a_s
+        b_counts = b_counts + b_c
+        b_sum += b_s
+    return a_counts, a_sum / n_samples, b_counts, b_sum / n_samples
+
+
+def run_monte_carlo(states, base_cost, base_turnout, voters, impact, n_samples,
+                    seed=0, national=False, chunk_size=CHUNK_SIZE, n_bins=N_BINS, workers=None):
+    """Sample cost and turnout outcomes for every state at one slider position.
+
+    With ``national=True`` the all-India savings total and voter-weighted
+    turnout are sampled too, drawing independently per state, from at most
+    NATIONAL_MAX_SAMPLES samples. ``workers=None``
+    picks the process pool automatically for large runs; ``workers=1``
+    always runs inline and any larger value uses the shared pool, which is
+    sized to the CPU count.
+    """
+    base_cost = np.asarray(base_cost, dtype=np.float64)
+    base_turnout = np.asarray(base_turnout, dtype=np.float64)
+    voters = np.asarray(voters, dtype=np.float64)
+    x_lo, x_hi = _triangular_range()
+    z_lim = TURNOUT_CLIP_SD * TURNOUT_SHIFT_SD
+    z_edges = np.linspace(-z_lim, z_lim, n_bins + 1)
+
+    x_counts, x_mean, z_counts, z_mean = _run_chunks(
+        _standard_chunk, lambda ss, n: (ss, n, n_bins),
+        n_samples, seed, 0, chunk_size, workers, draws_per_sample=3,
+    )
+    result = dict(
+        states=tuple(states),
+        n_samples=n_samples,
+        base_cost=base_cost,
+        base_turnout=base_turnout,
+        impact=impact,
+        cost_factor=Distribution(np.linspace(x_lo, x_hi, n_bins + 1), x_counts, x_mean),
+        turnout_shift=Distribution(z_edges, z_counts, z_mean),
+    )
+
+    if national:
+        voter_share = voters / voters.sum()
+        cost_sum = base_cost.sum()
+        # Keep each (rows, states) block around the size of a standard chunk.
+        rows = max(1_000, chunk_size * 8 // len(base_cost))
+        national_samples = min(n_samples, NATIONAL_MAX_SAMPLES)
+        t_counts, t_mean, s_counts, s_mean = _run_chunks(
+            _national_chunk, lambda ss, n: (ss, n, base_cost, voter_share, n_bins),
+            national_samples, seed, 1, rows, workers, draws_per_sample=3 * len(base_cost),
+        )
+        result['national_samples'] = national_samples
+        national_turnout = float(voter_share @ base_turnout) + impact
+        result['national_savings'] = Distribution(
+            np.linspace(x_lo * cost_sum, x_hi * cost_sum, n_bins + 1), t_counts, t_mean)
+        result['national_turnout'] = Distribution(z_edges, s_counts, s_mean).scaled(1.0, national_turnout)
+
+    return UncertaintyResult(**result)
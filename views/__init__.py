@@ -0,0 +1 @@
+"""Page modules, imported on demand by app.py."""
@@ -0,0 +1,32 @@
+"""Debug sidebar panel: this rerun's section timings and process-wide percentiles."""
+import streamlit as st
+
+import profiling
+from resources import get_chart_renderer, get_content_store, get_dataset
+
+
+def render(run):
+    with st.expander("🛠️ Debug: performance", expanded=True):
+        st.caption(f"This rerun ({run.page}): {run.total * 1000:.1f} ms • "
+                   f"session state {run.session_state_bytes / 1024:.1f} KB")
+        st.dataframe([{'section': name, 'ms': round(seconds * 1000, 2)} for name, seconds in run.sections],
+                     hide_index=True)
+
+        st.caption("Recent reruns, all sessions (fragment reruns are listed as page:fragment)")
+        st.dataframe(profiling.metrics.summary(), hide_index=True)
+        st.dataframe(profiling.metrics.session_state_summary(), hide_index=True)
+
+        data_stats = get_dataset().stats
+        st.caption(
+            f"Data: {data_stats.source} • {data_stats.rows:,} rows • loaded in {data_stats.load_seconds * 1000:.0f} ms • "
+            f"{data_stats.frame_mb:.1f} MB frame, {data_stats.rss_mb:.0f} MB RSS after load"
+        )
+        chart_stats = get_chart_renderer().stats()
+        st.caption(
+            f"Chart cache: hit rate {chart_stats['hit_rate']:.0%} ({chart_stats['hits']} hits, {chart_stats['misses']} misses) • "
+            f"{chart_stats['entries']} charts, {chart_stats['bytes'] / 1024:.0f} KB • "
+            f"avg render {chart_stats['avg_render_ms']:.1f} ms"
+        )
+        packs = get_content_store().stats()
+        st.caption(f"Language packs: {', '.join(packs['resident'])} resident • "
+                   f"{packs['loads']} loads, {packs['evictions']} evictions")
@@ -0,0 +1,60 @@
+"""Election Calendar page: synchronization schedules for every legislature."""
+import datetime
+
+import streamlit as st
+
+from calendar_sync import (
+    DISRUPTION_WEIGHT, FIXED, MAX_CURTAIL, MAX_EXTEND, MAX_PHASES, PHASE_OVERHEAD,
+    InfeasibleSchedule, solve,
+)
+from profiling import profiled, timed
+from resources import load_legislatures
+
+
+def render(t, lang_choice):
+    st.title(f"🗓️ {t['cal_title']}")
+    st.write(t['cal_desc'])
+    _calendar_panel(t, load_legislatures())
+
+
+# Constraint changes re-solve (a few ms) and rerun only this panel.
+@st.fragment
+@profiled('election_calendar', st.session_state)
+def _calendar_panel(t, legislatures):
+    c1, c2, c3 = st.columns(3)
+    max_phases = c1.slider(t['cal_max_phases'], 1, 8, MAX_PHASES)
+    max_curtail = c2.slider(t['cal_max_curtail'], 0, 60, MAX_CURTAIL)
+    max_extend = c3.slider(t['cal_max_extend'], 0, 36, MAX_EXTEND)
+    c4, c5, c6 = st.columns(3)
+    weight = c4.number_input(t['cal_weight'], min_value=0.0, value=DISRUPTION_WEIGHT, step=5.0)
+    overhead = c5.number_input(t['cal_overhead'], min_value=0.0, value=PHASE_OVERHEAD, step=100.0)
+    fix_lok_sabha = c6.checkbox(t['cal_fix_ls'], value=True)
+
+    try:
+        with timed('solve'):
+            schedule = solve(
+                legislatures, max_curtail=max_curtail, max_extend=max_extend, max_phases=max_phases,
+                disruption_weight=weight, phase_overhead=overhead,
+                fixed=FIXED if fix_lok_sabha else (), earliest=datetime.date.today().strftime('%Y-%m'),
+            )
+    except InfeasibleSchedule:
+        st.warning(t['cal_infeasible'])
+        return
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric(t['cal_phases_metric'], len(schedule.phases))
+    m2.metric(t['cal_expenditure'], f"₹{schedule.expenditure:,.0f} Cr",
+              delta=f"-₹{schedule.savings:,.0f} Cr", delta_color='inverse')
+    m3.metric(t['cal_disruption'], f"-{schedule.curtailed_months} / +{schedule.extended_months}")
+
+    for n, (date, members) in enumerate(schedule.phases, start=1):
+        st.markdown(f"**{t['cal_phase'].format(n=n, date=date)}:** {', '.join(members)}")
+
+    st.caption(t['cal_term_change'])
+    st.bar_chart(schedule.assignments, x='Legislature', y='Term Change (months)')
+
+    with st.expander(t['cal_frontier']):
+        st.dataframe(schedule.frontier, hide_index=True)
+    with st.expander(t['cal_assignments']):
+        st.dataframe(schedule.assignments, hide_index=True)
+    st.caption(t['cal_solved'].format(ms=f"{schedule.solve_ms:.1f}", n=len(legislatures)))
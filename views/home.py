@@ -0,0 +1,25 @@
+"""Home page: explainer, key metric, pros and cons."""
+import streamlit as st
+
+
+def render(t, lang_choice):
+    st.title(t['title'])
+    st.caption(t['subtitle'])
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown(f"### {t['welcome']}")
+        st.write(t['intro'])
+        st.markdown(f"**{t['what_is_title']}**")
+        st.write(t['what_is_desc'])
+    with col2:
+        st.metric(label=t['metric_voters'], value="96.8 Cr", delta=t['metric_voters_delta'])
+
+    st.divider()
+    c1, c2 = st.columns(2)
+    with c1:
+        st.subheader(f"✅ {t['pros']}")
+        st.success(t['pros_list'])
+    with c2:
+        st.subheader(f"⚠️ {t['cons']}")
+        st.error(t['cons_list'])
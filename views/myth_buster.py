@@ -0,0 +1,98 @@
+"""Myth Buster page: ranked fact search and the misinformation reporter."""
+import os
+import time
+
+import streamlit as st
+
+from profiling import profiled, timed
+from resources import get_content_store, get_fact_index, get_report_ingestor, load_report_preview
+
+MAX_MYTH_RESULTS = 50
+# Streamlit's built-in 250 ms pause. A duration string such as '300ms' is
+# parsed with pandas, which would load pandas and pyarrow on this page.
+SEARCH_DEBOUNCE = True
+# Reported images are only listed on deployments run with ONOE_MODERATOR=1.
+MODERATOR_ENV = 'ONOE_MODERATOR'
+
+
+def render(t, lang_choice):
+    st.title(f"🛡️ {t['nav_myth']}")
+    _search_panel(t, lang_choice)
+    _report_panel(t)
+
+
+# Typing reruns only the search results, not the whole app.
+@st.fragment
+@profiled('myth_buster', st.session_state)
+def _search_panel(t, lang_choice):
+    content = get_content_store()
+    
+    # Search Bar (commits after a pause in typing)
+    query = st.text_input(t['myth_search'], "", type='search', live=SEARCH_DEBOUNCE)
+    
+    # Myth Cards (ranked lookup in the shared index)
+    with timed('search'):
+        facts_db = content.facts(lang_choice)
+        fact_index = get_fact_index(content.version('facts', lang_choice), facts_db)
+        matches = fact_index.search(query, limit=MAX_MYTH_RESULTS)
+    for key in matches:
+        data = facts_db[key]
+        with st.expander(f"🛑 {t['myth_label']}: {data['myth']}", expanded=True):
+            st.markdown(f"### ✅ {t['fact_label']}: {data['fact']}")
+            st.caption(f"{t['source']}: {data['source']}")
+    
+    if not matches:
+        st.warning(t['myth_no_match'])
+
+
+@st.fragment
+@profiled('myth_buster', st.session_state)
+def _report_panel(t):
+    # Reporter: stored on disk and grouped with near-duplicate screenshots
+    st.divider()
+    st.subheader(t['report_title'])
+    uploaded_file = st.file_uploader(t['report_upload'], type=['png', 'jpg'])
+    if uploaded_file:
+        from ingestion import UnreadableImage, UploadTooLarge
+
+        # Ingest each upload once, not on every rerun of this panel
+        ingested = st.session_state.setdefault('ingested_reports', {})
+        if uploaded_file.file_id not in ingested:
+            try:
+                with timed('ingest'):
+                    ingested[uploaded_file.file_id] = get_report_ingestor().ingest(
+                        uploaded_file, suffix=os.path.splitext(uploaded_file.name)[1].lower())
+            except UploadTooLarge as e:
+                st.error(str(e))
+                return
+            except (UnreadableImage, OSError):
+                st.error(t['report_unreadable'])
+                return
+        report = ingested[uploaded_file.file_id]
+        if report['new']:
+            st.success(t['report_uploaded'])
+        else:
+            st.success(t['report_repeat'].format(count=f"{report['reports']:,}"))
+
+    if os.environ.get(MODERATOR_ENV) == '1':
+        _moderator_view(t)
+
+
+def _moderator_view(t):
+    from ingestion import UnreadableImage
+
+    with st.expander(t['moderator_view']):
+        top = get_report_ingestor().top_images()
+        if not top:
+            st.caption(t['no_reports'])
+        for row in top:
+            c1, c2 = st.columns([1, 3])
+            with c1:
+                try:
+                    st.image(load_report_preview(row['sample_path']))
+                except UnreadableImage:
+                    st.caption('—')
+            with c2:
+                st.markdown(f"**Reports:** {row['reports']:,}  \n"
+                            f"**Last reported:** {time.strftime('%Y-%m-%d %H:%M', time.localtime(row['last_seen']))}")
+                st.caption(row['hash'])
@@ -0,0 +1,102 @@
+"""Voter Quiz page."""
+import streamlit as st
+
+from profiling import profiled, timed
+from resources import get_content_store, get_submission_sink, load_quiz_aggregates
+
+
+def render(t, lang_choice):
+    content = get_content_store()
+    st.title(f"🧠 {t['quiz_title']}")
+    st.markdown(t['quiz_intro'])
+
+    quiz_data = content.quiz(lang_choice)
+
+    # ------------------------------------------
+    # QUIZ LOGIC & FORM
+    # ------------------------------------------
+    _quiz_form(t, quiz_data, content.version('quiz', lang_choice), lang_choice)
+
+
+# Submitting reruns only the form and its results.
+@st.fragment
+@profiled('quiz', st.session_state)
+def _quiz_form(t, quiz_data, quiz_version, lang_choice):
+    score = 0
+    # Choices are read from the radios on submit; nothing is copied into
+    # session state on every rerun.
+    user_answers = {}
+    
+    with st.form("quiz_form"):
+        for i, q in enumerate(quiz_data):
+            st.subheader(q['question'])
+            # Helper to get previous selection if available
+            default_idx = None
+            
+            # Display Radio Button
+            choice = st.radio(
+                t['quiz_select'], 
+                q['options'], 
+                key=f"q_{i}", 
+                index=default_idx
+            )
+            user_answers[i] = choice
+            st.markdown("---")
+        
+        submitted = st.form_submit_button(t['quiz_submit'])
+        
+        if submitted:
+            st.write(f"## 📝 {t['quiz_results']}")
+            for i, q in enumerate(quiz_data):
+                user_ans = user_answers.get(i)
+                
+                # Check Answer
+                if user_ans == q['answer']:
+                    score += 1
+                    st.success(f"**Q{i+1}: {t['quiz_correct']}** \n{q['explanation']}")
+                else:
+                    st.error(f"**Q{i+1}: {t['quiz_incorrect']}** \n{t['quiz_your_answer']}: {user_ans} \n{t['quiz_correct_answer']}: **{q['answer']}** \n{t['quiz_explanation']}: {q['explanation']}")
+            
+            # Queued for the background writer; does not wait on disk
+            with timed('submit'):
+                get_submission_sink().submit(
+                    quiz_version, lang_choice,
+                    [user_answers.get(i) == q['answer'] for i, q in enumerate(quiz_data)],
+                    [user_answers.get(i) for i in range(len(quiz_data))],
+                )
+            
+            # Final Score Display
+            final_score_pct = (score / len(quiz_data)) * 100
+            st.metric(label=t['quiz_final_score'], value=f"{score}/{len(quiz_data)}", delta=f"{final_score_pct}%")
+            
+            if score >= 7:
+                st.balloons()
+                st.success(t['quiz_excellent'])
+            elif score >= 4:
+                st.info(t['quiz_good'])
+            else:
+                st.warning(t['quiz_keep_learning'])
+
+    _community_stats(t, quiz_version)
+
+
+def _community_stats(t, quiz_version):
+    # Read from incrementally maintained counters, refreshed every few seconds
+    stats = load_quiz_aggregates(quiz_version)
+    if not stats['submissions']:
+        return
+    count = f"{stats['submissions']:,}"
+    # Drawn as progress bars: st.bar_chart would load pandas and pyarrow on
+    # every quiz visit, even with the expander closed.
+    with st.expander(f"📊 {t['quiz_community'].format(count=count)}"):
+        c1, c2 = st.columns(2)
+        with c1:
+            st.caption(t['quiz_per_question'])
+            for row in stats['questions']:
+                rate = row['correct_rate']
+                st.progress(rate, text=f"Q{row['question'] + 1:02d} · {100 * rate:.0f}%")
+        with c2:
+            st.caption(t['quiz_score_dist'])
+            most = max(stats['scores'].values())
+            for score, n in stats['scores'].items():
+                st.progress(n / most, text=f"{score} · {n:,}")
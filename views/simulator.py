@@ -0,0 +1,145 @@
+"""Impact Simulator page: scenario grid, chart, uncertainty mode and export."""
+import pandas as pd
+import streamlit as st
+
+from export import FORMATS, build_tables
+from logistics import MAX_STATE_PHASES, LogisticsParams
+from profiling import profiled, timed
+from resources import (
+    get_chart_renderer, get_logistics_model, get_report_exporter,
+    load_data, load_scenario_grid, load_uncertainty,
+)
+from simulation import TURNOUT_MIN, TURNOUT_MAX, TURNOUT_DEFAULT
+from uncertainty import SAMPLE_SIZES
+
+
+def render(t, lang_choice):
+    with timed('load_data'):
+        df = load_data()
+
+    st.title(f"📊 {t['sim_title']}")
+    st.write(t['sim_desc'])
+    _simulator_panel(t, lang_choice, df)
+
+
+# Slider, selectbox and export interactions rerun only this panel.
+@st.fragment
+@profiled('simulator', st.session_state)
+def _simulator_panel(t, lang_choice, df):
+    col_input, col_viz = st.columns([1, 2])
+    
+    with col_input:
+        st.markdown(f"### {t['params_title']}")
+        selected_state = st.selectbox(t['state_sel'], df['State'])
+        
+        # Scenario Slider
+        turnout_impact = st.slider(t['turnout_sel'], TURNOUT_MIN, TURNOUT_MAX, TURNOUT_DEFAULT)
+        
+        # Lookup into the precomputed state x turnout grid
+        with timed('grid_lookup'):
+            grid = load_scenario_grid(df)
+            result = grid.lookup(selected_state, turnout_impact)
+        cost_current_5yr = result['cost_current_5yr']
+        cost_onoe_5yr = result['cost_onoe_5yr']
+        savings = result['savings']
+        
+    with col_viz:
+        st.markdown(f"### {t['analysis_for'].format(state=selected_state)}")
+        
+        # 1. Cost Comparison Chart (Hindi leaves the chart keys to the English
+        # fallback: matplotlib's bundled font has no Devanagari glyphs)
+        chart_renderer = get_chart_renderer()
+        categories = [t['chart_current'], t['chart_onoe']]
+        costs = [cost_current_5yr, cost_onoe_5yr]
+        with timed('chart'):
+            chart = chart_renderer.cost_chart(selected_state, lang_choice, categories, costs, t['chart_xlabel'])
+        st.image(chart)
+        
+        # 2. Metrics
+        m1, m2 = st.columns(2)
+        m1.metric(t['savings_label'], f"₹{int(savings)} Cr", delta=t['savings_delta'])
+        m2.metric(t['turnout_label'], f"{result['turnout']}%", delta=f"{turnout_impact}%")
+
+        # 3. Uncertainty Mode (Monte Carlo)
+        if st.toggle(t['uncertainty_toggle'], help=t['uncertainty_help']):
+            u1, u2, u3 = st.columns(3)
+            n_samples = u1.select_slider(t['samples'], options=SAMPLE_SIZES, format_func=lambda n: f"{n:,}")
+            seed = u2.number_input(t['seed'], min_value=0, value=42, step=1)
+            national = u3.checkbox(t['national_total'], help=t['national_help'])
+            with timed('uncertainty'):
+                mc = load_uncertainty(df, turnout_impact, n_samples, int(seed), national)
+
+            bands = {t['band_savings'].format(state=selected_state): mc.savings(selected_state),
+                     t['band_turnout'].format(state=selected_state): mc.turnout(selected_state)}
+            if national:
+                bands[t['band_national_savings']] = mc.national_savings
+                bands[t['band_national_turnout']] = mc.national_turnout
+            st.dataframe(
+                pd.DataFrame({name: dist.percentiles() for name, dist in bands.items()}).T
+                .rename(columns=lambda q: f"P{q}").round(1)
+            )
+
+            h1, h2 = st.columns(2)
+            for col, (name, dist) in zip((h1, h2), list(bands.items())[:2]):
+                centers, counts = dist.histogram()
+                col.caption(name)
+                col.bar_chart(pd.DataFrame({'Value': centers.round(1), 'Samples': counts}), x='Value', y='Samples')
+
+    # All-States Comparison (same slider position, no per-state loop)
+    with st.expander(t['compare_states']):
+        st.dataframe(grid.compare_states(turnout_impact), hide_index=True)
+
+    with st.expander(t['logistics_title']):
+        _logistics(t, selected_state)
+
+    # Export Data Button
+    st.markdown(f"### {t['export_title']}")
+    e1, e2 = st.columns(2)
+    export_fmt = e1.selectbox(t['export_format'], list(FORMATS), format_func=lambda f: FORMATS[f][0])
+    all_states = e2.checkbox(t['export_all_states'])
+    exporter = get_report_exporter()
+    fmt_label, ext, mime = FORMATS[export_fmt]
+    scope = 'all_states' if all_states else selected_state
+    
+    # Generated lazily on click, off the script thread
+    def make_report():
+        with timed(f'export_{export_fmt}'):
+            tables = build_tables(df, grid, selected_state, turnout_impact, all_states=all_states)
+            return exporter.export(tables, export_fmt)
+    
+    st.download_button(
+        label=f"📥 {t['download_btn'].format(format=fmt_label)}",
+        data=make_report,
+        file_name=f'onoe_sim_{scope}.{ext}',
+        mime=mime,
+        on_click='ignore',
+    )
+
+
+def _logistics(t, selected_state):
+    # Phase counts are per session; only a state whose count changes is
+    # re-aggregated, and only the first time any session asks for it.
+    phases = st.session_state.setdefault('logistics_phases', {})
+    l1, l2 = st.columns(2)
+    simultaneous = l1.toggle(t['logistics_simultaneous'], value=True)
+    candidates = l2.number_input(t['logistics_candidates'], min_value=2, max_value=64, value=15, step=1)
+    l3, l4 = st.columns(2)
+    phases[selected_state] = l3.slider(
+        t['logistics_phases'].format(state=selected_state), 1, MAX_STATE_PHASES, phases.get(selected_state, 1))
+    sensitive = l4.slider(t['logistics_sensitive'], 0, 100, 15)
+
+    params = LogisticsParams(polls=2 if simultaneous else 1, candidates=int(candidates), sensitive_share=sensitive / 100)
+    with timed('logistics'):
+        req = get_logistics_model().requirements(params, phases)
+    labels = {'Ballot Units': t['logistics_bu'], 'Control Units': t['logistics_cu'], 'VVPATs': t['logistics_vvpat'],
+              'Polling Staff': t['logistics_staff'], 'Security Personnel': t['logistics_security']}
+
+    state_row = req.by_state.set_index('State').loc[selected_state]
+    for col, (key, label) in zip(st.columns(len(labels)), labels.items()):
+        col.metric(label, f"{int(state_row[key]):,}")
+    st.dataframe(req.by_phase[req.by_phase['State'] == selected_state], hide_index=True)
+
+    st.caption(t['logistics_national'])
+    for col, (key, label) in zip(st.columns(len(labels)), labels.items()):
+        col.metric(label, f"{req.national[key]:,}")
+    st.dataframe(req.by_state, hide_index=True)